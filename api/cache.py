@@ -0,0 +1,71 @@
+"""JSON response helpers for read-heavy endpoints."""
+
+from typing import Any, Callable
+
+from fastapi.responses import Response
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+from core.artifacts.store import ArtifactStore
+
+
+def model_response(model: BaseModel) -> Response:
+    """Serve a model as JSON serialized directly by pydantic-core."""
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
+def json_response(payload: Any) -> Response:
+    """Serve plain data as JSON serialized by pydantic-core.
+
+    Datetimes, enums and models are encoded natively, so callers can pass
+    them through without converting them first.
+    """
+    return Response(content=to_json(payload), media_type="application/json")
+
+
+class CollectionCache:
+    """Pre-serialized JSON per artifact collection, invalidated by store writes."""
+
+    def __init__(self):
+        self._entries: dict[str, tuple[int, bytes]] = {}
+        self._adapters: dict[type[BaseModel], TypeAdapter] = {}
+
+    def _adapter(self, model_class: type[BaseModel]) -> TypeAdapter:
+        """Get (or build) the list serializer for a model class."""
+        adapter = self._adapters.get(model_class)
+        if adapter is None:
+            adapter = TypeAdapter(list[model_class])
+            self._adapters[model_class] = adapter
+        return adapter
+
+    def get(
+        self,
+        store: ArtifactStore,
+        artifact_type: str,
+        model_class: type[BaseModel],
+        loader: Callable[[], list[BaseModel]] | None = None,
+    ) -> bytes:
+        """Get the JSON array for a collection, rebuilding it only after writes."""
+        # Read the version before loading so a concurrent write marks us stale
+        version = store.version(artifact_type)
+        entry = self._entries.get(artifact_type)
+        if entry is None or entry[0] != version:
+            items = loader() if loader else store.list_all(artifact_type, model_class)
+            entry = (version, self._adapter(model_class).dump_json(items))
+            self._entries[artifact_type] = entry
+        return entry[1]
+
+    def response(
+        self,
+        store: ArtifactStore,
+        artifact_type: str,
+        model_class: type[BaseModel],
+        loader: Callable[[], list[BaseModel]] | None = None,
+    ) -> Response:
+        """Serve a collection as a ready-made JSON response."""
+        content = self.get(store, artifact_type, model_class, loader)
+        return Response(content=content, media_type="application/json")
+
+
+# Shared across routers so every endpoint sees the same cached payloads
+collection_cache = CollectionCache()
@@ -9,30 +9,24 @@ from fastapi.responses import FileResponse
 
 from core.artifacts.registry import DecisionRegistry
 from core.artifacts.store import ArtifactStore
+from core.llm.factory import LLMClientFactory
 from core.workspace.state import WorkspaceState
+from api import state
 from api.routes import agents, artifacts, meetings, workspace
 
 
-# Global state (initialized on startup)
-store: ArtifactStore | None = None
-workspace: WorkspaceState | None = None
-registry: DecisionRegistry | None = None
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan."""
-    global store, workspace, registry
-
-    # Startup
-    store = ArtifactStore("./workspace")
-    workspace = WorkspaceState(store)
-    registry = DecisionRegistry(store)
+    # Startup: routes read these through api.state at request time
+    state.store = ArtifactStore("./workspace")
+    state.workspace = WorkspaceState(state.store)
+    state.registry = DecisionRegistry(state.store)
 
     yield
 
     # Shutdown
-    pass
+    await LLMClientFactory.close_all()
 
 
 app = FastAPI(
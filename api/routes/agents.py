@@ -1,20 +1,75 @@
 """API routes for agents."""
 
+import threading
+from itertools import islice
+from typing import Any, KeysView, ValuesView
+
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from core.agents.base import BaseAgent
 from core.agents.bod import BoardOfDirectors
 from core.agents.ceo import CEOOrchestrator
 from core.agents.experts.engineering import EngineeringExpert
 from core.agents.experts.product import ProductExpert
 from core.agents.experts.strategy import StrategyExpert
 from core.llm.factory import LLMClientFactory
-from api.main import workspace
+from api import state
+from api.cache import json_response
 
 router = APIRouter()
 
+class AgentRegistry:
+    """Read-optimized agent registry using copy-on-write updates.
+
+    Readers use the current dict without locking. Writers copy it, apply the
+    change and rebind the reference under a lock, so a reader holding the old
+    snapshot never sees a dict being resized underneath it.
+    """
+
+    def __init__(self):
+        self._agents: dict[str, Any] = {}
+        # id/role/name never change, so each agent's listing entry is built once
+        self._summaries: dict[str, dict[str, str]] = {}
+        self._write_lock = threading.Lock()
+
+    def register(self, agent: Any) -> None:
+        """Add an agent to the registry."""
+        with self._write_lock:
+            agents = self._agents.copy()
+            agents[agent.id] = agent
+            summaries = self._summaries.copy()
+            summaries[agent.id] = agent.summary()
+            self._agents = agents
+            self._summaries = summaries
+
+    def summaries(self) -> ValuesView[dict[str, str]]:
+        """Get the id/role/name listing of all registered agents."""
+        return self._summaries.values()
+
+    def get(self, agent_id: str) -> Any | None:
+        """Get an agent by ID."""
+        return self._agents.get(agent_id)
+
+    def __getitem__(self, agent_id: str) -> Any:
+        return self._agents[agent_id]
+
+    def keys(self) -> KeysView[str]:
+        """View of registered agent IDs (a consistent snapshot)."""
+        return self._agents.keys()
+
+
 # In-memory agent registry for the API
-_agent_registry: dict[str, any] = {}
+_agent_registry = AgentRegistry()
+
+# Role -> (agent class, default display name)
+_ROLE_FACTORIES: dict[str, tuple[type[BaseAgent], str]] = {
+    "BOD": (BoardOfDirectors, "Board of Directors"),
+    "CEO": (CEOOrchestrator, "CEO"),
+    "Strategy": (StrategyExpert, "Strategy Expert"),
+    "Product": (ProductExpert, "Product Expert"),
+    "Engineering": (EngineeringExpert, "Engineering Expert"),
+}
 
 
 class AgentCreateRequest(BaseModel):
@@ -38,33 +93,23 @@ async def create_agent(request: AgentCreateRequest):
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-    if request.role == "BOD":
-        agent = BoardOfDirectors(llm_client, request.name or "Board of Directors")
-    elif request.role == "CEO":
-        agent = CEOOrchestrator(llm_client, request.name or "CEO")
-    elif request.role == "Strategy":
-        agent = StrategyExpert(llm_client, request.name or "Strategy Expert")
-    elif request.role == "Product":
-        agent = ProductExpert(llm_client, request.name or "Product Expert")
-    elif request.role == "Engineering":
-        agent = EngineeringExpert(llm_client, request.name or "Engineering Expert")
-    else:
+    entry = _ROLE_FACTORIES.get(request.role)
+    if entry is None:
         raise HTTPException(status_code=400, detail=f"Unknown role: {request.role}")
+    agent_class, default_name = entry
+    agent = agent_class(llm_client, request.name or default_name)
 
-    _agent_registry[agent.id] = agent
-    if workspace:
-        workspace.register_agent(agent)
+    _agent_registry.register(agent)
+    if state.workspace:
+        state.workspace.register_agent(agent)
 
     return AgentResponse(id=agent.id, role=agent.role, name=agent.name)
 
 
-@router.get("/list")
+@router.get("/list", response_model=list[AgentResponse])
 async def list_agents():
     """List all registered agents."""
-    return [
-        {"id": a.id, "role": a.role, "name": a.name}
-        for a in _agent_registry.values()
-    ]
+    return _agent_registry.summaries()
 
 
 @router.get("/{agent_id}")
@@ -74,16 +119,17 @@ async def get_agent(agent_id: str):
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
 
-    return {
+    return json_response({
         "id": agent.id,
         "role": agent.role,
         "name": agent.name,
         "context": agent.context,
         "thoughts": [
-            {"content": t.content, "timestamp": t.timestamp.isoformat()}
-            for t in agent.thoughts[-10:]  # Last 10 thoughts
+            {"content": t.content, "timestamp": t.timestamp}
+            # Last 10 thoughts, oldest first
+            for t in reversed(list(islice(reversed(agent.thoughts), 10)))
         ],
-    }
+    })
 
 
 @router.post("/{agent_id}/act")
@@ -2,55 +2,62 @@
 
 from fastapi import APIRouter, HTTPException
 
-from core.artifacts.models import ActionItem, Decision, Initiative, MeetingLog
-from api.main import registry, store
+from core.artifacts.models import ActionItem, Decision, DecisionStatus, Initiative
+from api import state
+from api.cache import collection_cache, model_response
 
 router = APIRouter()
 
 
-@router.get("/decisions")
+# List endpoints return pre-serialized JSON; response_model documents the shape
+@router.get("/decisions", response_model=list[Decision])
 async def list_decisions():
     """List all decisions."""
-    decisions = registry.list_all()
-    return [d.model_dump() for d in decisions]
+    return collection_cache.response(
+        state.store, "decision", Decision, state.registry.list_all
+    )
 
 
-@router.get("/decisions/{decision_id}")
+@router.get("/decisions/{decision_id}", response_model=Decision)
 async def get_decision(decision_id: str):
     """Get a specific decision."""
-    decision = registry.get(decision_id)
+    decision = state.registry.get(decision_id)
     if not decision:
         raise HTTPException(status_code=404, detail="Decision not found")
-    return decision.model_dump()
+    return model_response(decision)
 
 
-@router.post("/decisions/{decision_id}/approve")
+@router.post("/decisions/{decision_id}/approve", response_model=Decision)
 async def approve_decision(decision_id: str, approved_by: str = "user"):
     """Approve a decision."""
-    from core.artifacts.models import DecisionStatus
+    decision = state.registry.get(decision_id)
+    if not decision:
+        raise HTTPException(status_code=404, detail="Decision not found")
+
+    # Repeated approvals are common (client retries); skip the write if nothing changes
+    if decision.status == DecisionStatus.APPROVED and decision.approved_by == approved_by:
+        return model_response(decision)
 
-    decision = registry.update_status(decision_id, DecisionStatus.APPROVED, approved_by)
+    decision = state.registry.update_status(decision_id, DecisionStatus.APPROVED, approved_by)
     if not decision:
         raise HTTPException(status_code=404, detail="Decision not found")
-    return decision.model_dump()
+    return model_response(decision)
 
 
-@router.get("/action-items")
+@router.get("/action-items", response_model=list[ActionItem])
 async def list_action_items():
     """List all action items."""
-    actions = store.list_all("action_item", ActionItem)
-    return [a.model_dump() for a in actions]
+    return collection_cache.response(state.store, "action_item", ActionItem)
 
 
-@router.get("/initiatives")
+@router.get("/initiatives", response_model=list[Initiative])
 async def list_initiatives():
     """List all initiatives."""
-    initiatives = store.list_all("initiative", Initiative)
-    return [i.model_dump() for i in initiatives]
+    return collection_cache.response(state.store, "initiative", Initiative)
 
 
-@router.post("/initiatives")
+@router.post("/initiatives", response_model=Initiative)
 async def create_initiative(initiative: Initiative):
     """Create a new initiative."""
-    store.save("initiative", initiative.id, initiative)
-    return initiative.model_dump()
+    state.store.save("initiative", initiative.id, initiative)
+    return model_response(initiative)
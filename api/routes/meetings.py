@@ -1,24 +1,23 @@
 """API routes for meetings."""
 
+import functools
+
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from core.artifacts.models import MeetingLog
 from core.meetings.engine import MeetingEngine
 from core.meetings.types import MeetingType
-from api.main import workspace
+from api import state
+from api.cache import collection_cache, model_response
 from api.routes.agents import _agent_registry
 
 router = APIRouter()
 
-_meeting_engine: MeetingEngine | None = None
-
-
+@functools.cache
 def _get_engine() -> MeetingEngine:
-    global _meeting_engine
-    if _meeting_engine is None:
-        from api.main import store
-        _meeting_engine = MeetingEngine(store)
-    return _meeting_engine
+    """Get the shared meeting engine, created on first use after startup."""
+    return MeetingEngine(state.store)
 
 
 class MeetingCreateRequest(BaseModel):
@@ -26,6 +25,7 @@ class MeetingCreateRequest(BaseModel):
     meeting_type: str
     agenda: list[str]
     participant_ids: list[str]
+    max_concurrency: int | None = Field(None, ge=1, description="Max simultaneous LLM calls")
 
 
 class MeetingCreateResponse(BaseModel):
@@ -39,13 +39,14 @@ async def create_meeting(request: MeetingCreateRequest):
     """Create a new meeting."""
     engine = _get_engine()
 
-    # Get participants
-    participants = []
-    for pid in request.participant_ids:
-        agent = _agent_registry.get(pid)
-        if not agent:
-            raise HTTPException(status_code=404, detail=f"Agent {pid} not found")
-        participants.append(agent)
+    # Validate all participants up front, then resolve them in one pass
+    missing = set(request.participant_ids) - _agent_registry.keys()
+    if missing:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Agents not found: {', '.join(sorted(missing))}",
+        )
+    participants = [_agent_registry[pid] for pid in request.participant_ids]
 
     try:
         meeting_type = MeetingType(request.meeting_type)
@@ -57,6 +58,7 @@ async def create_meeting(request: MeetingCreateRequest):
         meeting_type=meeting_type,
         agenda=request.agenda,
         participants=participants,
+        max_concurrency=request.max_concurrency,
     )
 
     return MeetingCreateResponse(
@@ -78,24 +80,17 @@ async def run_meeting(meeting_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/{meeting_id}")
+@router.get("/list", response_model=list[MeetingLog])
+async def list_meetings():
+    """List all meetings."""
+    return collection_cache.response(state.store, "meeting", MeetingLog)
+
+
+@router.get("/{meeting_id}", response_model=MeetingLog)
 async def get_meeting(meeting_id: str):
     """Get meeting details."""
-    from core.artifacts.models import MeetingLog
-    from api.main import store
-
-    meeting = store.load("meeting", meeting_id, MeetingLog)
+    meeting = state.store.load("meeting", meeting_id, MeetingLog)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
-    return meeting.model_dump()
-
-
-@router.get("/list")
-async def list_meetings():
-    """List all meetings."""
-    from core.artifacts.models import MeetingLog
-    from api.main import store
-
-    meetings = store.list_all("meeting", MeetingLog)
-    return [m.model_dump() for m in meetings]
+    return model_response(meeting)
@@ -2,37 +2,36 @@
 
 from fastapi import APIRouter
 
-from api.main import workspace
+from core.artifacts.models import WorkspaceSnapshot
+from api import state
+from api.cache import model_response
+from api.routes.agents import AgentResponse
 
 router = APIRouter()
 
 
-@router.get("/snapshot")
+@router.get("/snapshot", response_model=WorkspaceSnapshot | dict[str, str])
 async def get_snapshot():
     """Get current workspace snapshot."""
-    if not workspace:
+    if not state.workspace:
         return {"error": "Workspace not initialized"}
 
-    snapshot = workspace.get_snapshot()
-    return snapshot.model_dump()
+    return model_response(state.workspace.get_snapshot())
 
 
 @router.get("/metrics")
 async def get_metrics():
     """Get workspace metrics."""
-    if not workspace:
+    if not state.workspace:
         return {"error": "Workspace not initialized"}
 
-    return workspace.get_metrics()
+    return state.workspace.get_metrics()
 
 
-@router.get("/agents")
+@router.get("/agents", response_model=list[AgentResponse] | dict[str, str])
 async def get_workspace_agents():
     """Get agents in workspace."""
-    if not workspace:
+    if not state.workspace:
         return {"error": "Workspace not initialized"}
 
-    return [
-        {"id": a.id, "role": a.role, "name": a.name}
-        for a in workspace.agents.values()
-    ]
+    return state.workspace.get_agent_summaries()
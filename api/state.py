@@ -0,0 +1,9 @@
+"""Shared application state, populated by the FastAPI lifespan in api.main."""
+
+from core.artifacts.registry import DecisionRegistry
+from core.artifacts.store import ArtifactStore
+from core.workspace.state import WorkspaceState
+
+store: ArtifactStore | None = None
+workspace: WorkspaceState | None = None
+registry: DecisionRegistry | None = None
@@ -1,16 +1,51 @@
 """Base agent class for DeamCompan."""
 
-import uuid
+import asyncio
+import itertools
+import secrets
 from abc import ABC, abstractmethod
-from typing import Any
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 from core.artifacts.models import AgentThought
-from core.llm.base import LLMClient, LLMMessage
+from core.llm.base import LLMClient
+
+
+# Agent IDs: a random per-process prefix plus a monotonically increasing counter
+_ID_NONCE = secrets.token_hex(2)
+_ID_COUNTER = itertools.count()
 
 
 class BaseAgent(ABC):
     """Base class for all agents in DeamCompan."""
 
+    __slots__ = (
+        "id",
+        "role",
+        "name",
+        "llm_client",
+        "system_prompt",
+        "context",
+        "thoughts",
+        "_prompt_prefix",
+    )
+
+    # Only the most recent thoughts are kept; older ones are dropped
+    MAX_THOUGHTS = 256
+
+    # Task "action" name -> handler method name, declared by subclasses
+    ACTIONS: dict[str, str] = {}
+    # Actions that only read the task and call the LLM, so they can overlap
+    PARALLEL_SAFE_ACTIONS: frozenset[str] = frozenset()
+    _action_handlers: dict[str, Callable[..., Awaitable[dict[str, Any]]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Resolve handler names once per class so dispatch is a single dict lookup
+        cls._action_handlers = {
+            action: getattr(cls, method) for action, method in cls.ACTIONS.items()
+        }
+
     def __init__(
         self,
         role: str,
@@ -18,17 +53,20 @@ class BaseAgent(ABC):
         llm_client: LLMClient | None = None,
         system_prompt: str = "",
     ):
-        self.id = str(uuid.uuid4())[:8]
+        self.id = f"{_ID_NONCE}{next(_ID_COUNTER):06x}"
         self.role = role
         self.name = name or f"{role}_{self.id}"
         self.llm_client = llm_client
         self.system_prompt = system_prompt
         self.context: dict[str, Any] = {}
-        self.thoughts: list[AgentThought] = []
+        self.thoughts: deque[AgentThought] = deque(maxlen=self.MAX_THOUGHTS)
+        # System/context messages reused across think() calls
+        self._prompt_prefix: tuple[dict[str, str], ...] | None = None
 
     def set_context(self, key: str, value: Any) -> None:
         """Set context information for the agent."""
         self.context[key] = value
+        self._prompt_prefix = None
 
     def get_context(self, key: str) -> Any | None:
         """Get context information."""
@@ -49,32 +87,103 @@ class BaseAgent(ABC):
         self,
         prompt: str,
         temperature: float = 0.7,
+        system: str | None = None,
     ) -> str:
-        """Use LLM to generate a thought/response."""
+        """Use LLM to generate a thought/response.
+
+        ``system`` is sent as an extra system message after the agent's own
+        prompt and context. Put text that repeats across calls there (e.g. a
+        meeting's instructions) so providers can serve it from their prompt
+        cache, and keep the per-call details in ``prompt``.
+        """
         if not self.llm_client:
             raise ValueError(f"Agent {self.name} has no LLM client configured")
 
-        messages = []
-        if self.system_prompt:
-            messages.append(LLMMessage("system", self.system_prompt))
+        messages = self.build_messages(prompt, system)
+        response = await self.llm_client.complete(messages, temperature=temperature)
+        return response.content
+
+    async def think_stream(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        system: str | None = None,
+    ) -> AsyncIterator[str]:
+        """Like think(), but yield the response in chunks as they arrive."""
+        if not self.llm_client:
+            raise ValueError(f"Agent {self.name} has no LLM client configured")
 
-        # Add context as system message if available
-        if self.context:
-            context_str = "Context:\n" + "\n".join(
-                f"- {k}: {v}" for k, v in self.context.items()
-            )
-            messages.append(LLMMessage("system", context_str))
+        messages = self.build_messages(prompt, system)
+        async for chunk in self.llm_client.stream(messages, temperature=temperature):
+            yield chunk
 
-        messages.append(LLMMessage("user", prompt))
+    def build_messages(self, prompt: str, system: str | None = None) -> list[dict[str, str]]:
+        """Build the messages think() sends for a prompt."""
+        # Messages are passed as plain dicts, the form provider APIs consume
+        messages = [*self._get_prompt_prefix()]
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
+        return messages
 
-        response = await self.llm_client.complete(messages, temperature=temperature)
-        return response.content
+    async def batch_think(
+        self,
+        prompts: list[str],
+        temperature: float = 0.7,
+        system: str | None = None,
+    ) -> list[str]:
+        """Answer several prompts that share this agent's prefix, concurrently.
+
+        Results are returned in the order of ``prompts``.
+        """
+        return await asyncio.gather(
+            *(self.think(prompt, temperature, system) for prompt in prompts)
+        )
+
+    def _get_prompt_prefix(self) -> tuple[dict[str, str], ...]:
+        """Get the system messages that precede every prompt.
+
+        Built once and reused until set_context() changes the context.
+        """
+        if self._prompt_prefix is None:
+            prefix = []
+            if self.system_prompt:
+                prefix.append({"role": "system", "content": self.system_prompt})
+
+            # Add context as system message if available
+            if self.context:
+                context_str = "Context:\n" + "\n".join(
+                    f"- {k}: {v}" for k, v in self.context.items()
+                )
+                prefix.append({"role": "system", "content": context_str})
+
+            self._prompt_prefix = tuple(prefix)
+        return self._prompt_prefix
 
     @abstractmethod
     async def act(self, task: dict[str, Any]) -> dict[str, Any]:
         """Perform an action based on a task. Must be implemented by subclasses."""
         pass
 
+    async def act_many(self, tasks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Perform several tasks, overlapping those in PARALLEL_SAFE_ACTIONS.
+
+        See run_assignments; results are returned in the order of ``tasks``.
+        """
+        return await run_assignments([(self, task) for task in tasks])
+
+    async def _dispatch(self, task: dict[str, Any]) -> dict[str, Any]:
+        """Run the handler registered in ACTIONS for the task's action."""
+        action = task.get("action")
+        handler = self._action_handlers.get(action)
+        if handler is None:
+            return {"error": f"Unknown action: {action}"}
+        return await handler(self, task)
+
+    def summary(self) -> dict[str, str]:
+        """Identify the agent (id, role, name) for listings."""
+        return {"id": self.id, "role": self.role, "name": self.name}
+
     def to_dict(self) -> dict[str, Any]:
         """Serialize agent state."""
         return {
@@ -83,3 +192,31 @@ class BaseAgent(ABC):
             "name": self.name,
             "context": self.context,
         }
+
+
+async def run_assignments(
+    assignments: list[tuple[BaseAgent, dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    """Run agent tasks, overlapping those that are safe to run in parallel.
+
+    Tasks whose action is in the agent's PARALLEL_SAFE_ACTIONS are awaited
+    together with asyncio.gather; the remaining tasks then run one at a
+    time. Results are returned in the order of ``assignments``.
+    """
+    results: list[dict[str, Any] | None] = [None] * len(assignments)
+
+    parallel = [
+        i for i, (agent, task) in enumerate(assignments)
+        if task.get("action") in agent.PARALLEL_SAFE_ACTIONS
+    ]
+    outputs = await asyncio.gather(
+        *(assignments[i][0].act(assignments[i][1]) for i in parallel)
+    )
+    for i, output in zip(parallel, outputs):
+        results[i] = output
+
+    for i, (agent, task) in enumerate(assignments):
+        if results[i] is None:
+            results[i] = await agent.act(task)
+
+    return results
@@ -3,6 +3,7 @@
 from typing import Any
 
 from .base import BaseAgent
+from .render import render_context
 
 
 BOD_SYSTEM_PROMPT = """You are the Board of Directors (BOD) of a virtual company.
@@ -25,9 +26,55 @@ When making decisions:
 Be thorough but decisive. Your decisions shape the company's future."""
 
 
+_REVIEW_DECISION_TEMPLATE = """Review the following proposed decision:
+
+Title: {title}
+Description: {description}
+Rationale: {rationale}
+Alternatives: {alternatives}
+Expected Outcomes: {expected_outcomes}
+
+Provide your assessment in this format:
+1. RECOMMENDATION: [APPROVE / REJECT / REQUEST_MODIFICATION]
+2. RATIONALE: [Your reasoning]
+3. CONCERNS: [Any risks or issues]
+4. SUGGESTIONS: [Improvements if applicable]
+"""
+
+_SET_STRATEGY_TEMPLATE = """Based on the following context, define strategic goals for the company:
+
+Current State: {context}
+
+Provide:
+1. VISION: [Long-term vision statement]
+2. OBJECTIVES: [3-5 key objectives for the quarter]
+3. PRIORITIES: [Ranked list of initiatives]
+4. RISK_BOUNDARIES: [What to avoid or limit]
+"""
+
+_ASSESS_RISK_TEMPLATE = """Assess the risk of the following proposal:
+
+{proposal}
+
+Provide:
+1. RISK_LEVEL: [LOW / MEDIUM / HIGH / CRITICAL]
+2. KEY_RISKS: [List specific risks]
+3. MITIGATION: [How to reduce risks]
+4. RECOMMENDATION: [Proceed with caution / Modify / Reject]
+"""
+
+
 class BoardOfDirectors(BaseAgent):
     """Board of Directors agent for governance."""
 
+    __slots__ = ()
+
+    ACTIONS = {
+        "review_decision": "_review_decision",
+        "set_strategy": "_set_strategy",
+        "assess_risk": "_assess_risk",
+    }
+
     def __init__(self, llm_client=None, name: str = "Board of Directors"):
         super().__init__(
             role="BOD",
@@ -38,34 +85,18 @@ class BoardOfDirectors(BaseAgent):
 
     async def act(self, task: dict[str, Any]) -> dict[str, Any]:
         """Execute a BOD task."""
-        action = task.get("action")
-
-        if action == "review_decision":
-            return await self._review_decision(task)
-        elif action == "set_strategy":
-            return await self._set_strategy(task)
-        elif action == "assess_risk":
-            return await self._assess_risk(task)
-        else:
-            return {"error": f"Unknown action: {action}"}
+        return await self._dispatch(task)
 
     async def _review_decision(self, task: dict[str, Any]) -> dict[str, Any]:
         """Review a proposed decision."""
         decision = task.get("decision", {})
-        prompt = f"""Review the following proposed decision:
-
-Title: {decision.get('title', 'N/A')}
-Description: {decision.get('description', 'N/A')}
-Rationale: {decision.get('rationale', 'N/A')}
-Alternatives: {decision.get('alternatives', [])}
-Expected Outcomes: {decision.get('expected_outcomes', [])}
-
-Provide your assessment in this format:
-1. RECOMMENDATION: [APPROVE / REJECT / REQUEST_MODIFICATION]
-2. RATIONALE: [Your reasoning]
-3. CONCERNS: [Any risks or issues]
-4. SUGGESTIONS: [Improvements if applicable]
-"""
+        prompt = _REVIEW_DECISION_TEMPLATE.format(
+            title=decision.get("title", "N/A"),
+            description=decision.get("description", "N/A"),
+            rationale=decision.get("rationale", "N/A"),
+            alternatives=render_context(decision.get("alternatives", [])),
+            expected_outcomes=render_context(decision.get("expected_outcomes", [])),
+        )
         response = await self.think(prompt)
         self.add_thought(f"Reviewed decision: {decision.get('title')}")
 
@@ -78,16 +109,7 @@ Provide your assessment in this format:
     async def _set_strategy(self, task: dict[str, Any]) -> dict[str, Any]:
         """Set strategic goals."""
         context = task.get("context", {})
-        prompt = f"""Based on the following context, define strategic goals for the company:
-
-Current State: {context}
-
-Provide:
-1. VISION: [Long-term vision statement]
-2. OBJECTIVES: [3-5 key objectives for the quarter]
-3. PRIORITIES: [Ranked list of initiatives]
-4. RISK_BOUNDARIES: [What to avoid or limit]
-"""
+        prompt = _SET_STRATEGY_TEMPLATE.format(context=render_context(context))
         response = await self.think(prompt)
         self.add_thought("Set strategic goals")
 
@@ -99,16 +121,7 @@ Provide:
     async def _assess_risk(self, task: dict[str, Any]) -> dict[str, Any]:
         """Assess risk of a proposal."""
         proposal = task.get("proposal", {})
-        prompt = f"""Assess the risk of the following proposal:
-
-{proposal}
-
-Provide:
-1. RISK_LEVEL: [LOW / MEDIUM / HIGH / CRITICAL]
-2. KEY_RISKS: [List specific risks]
-3. MITIGATION: [How to reduce risks]
-4. RECOMMENDATION: [Proceed with caution / Modify / Reject]
-"""
+        prompt = _ASSESS_RISK_TEMPLATE.format(proposal=render_context(proposal))
         response = await self.think(prompt)
         self.add_thought(f"Assessed risk for: {proposal.get('title', 'Unknown')}")
 
@@ -26,9 +26,84 @@ When coordinating:
 You are the integrator - the single source of truth for priorities."""
 
 
+_PRIORITIZE_TEMPLATE = """Prioritize the following initiatives:
+
+Strategy: {strategy}
+Constraints: {constraints}
+Initiatives: {initiatives}
+
+Provide:
+1. RANKED_LIST: [Ordered by priority with rationale]
+2. RESOURCE_ALLOCATION: [How to distribute resources]
+3. DEPENDENCIES: [Key dependencies between initiatives]
+4. TIMELINE: [Suggested sequence and timing]
+"""
+
+_COORDINATE_MEETING_TEMPLATE = """Coordinate a {meeting_type} meeting with participants: {participants}
+
+Agenda items: {agenda}
+
+Provide:
+1. MEETING_STRUCTURE: [How to run the meeting efficiently]
+2. KEY_QUESTIONS: [Critical questions to address]
+3. DECISION_POINTS: [What needs to be decided]
+4. EXPECTED_OUTCOMES: [What should be achieved]
+"""
+
+_RESOLVE_CONFLICT_TEMPLATE = """Resolve the following conflict:
+
+Parties involved: {parties}
+Conflict description: {conflict}
+
+Provide:
+1. ROOT_CAUSE: [Underlying issue]
+2. OPTIONS: [Possible resolutions]
+3. RECOMMENDATION: [Best path forward with rationale]
+4. NEXT_STEPS: [Specific actions for each party]
+"""
+
+_PROPOSE_DECISION_TEMPLATE = """Propose a decision on: {topic}
+
+Options considered: {options}
+Context: {context}
+
+Provide a formal decision proposal with:
+1. TITLE: [Clear decision statement]
+2. DESCRIPTION: [What is being decided]
+3. RATIONALE: [Why this is the right choice]
+4. ALTERNATIVES: [Other options and why rejected]
+5. EXPECTED_OUTCOMES: [What will happen if approved]
+6. RISKS: [Potential downsides and mitigations]
+"""
+
+_ALLOCATE_RESOURCES_TEMPLATE = """Allocate resources:
+
+Available: {available}
+Requests: {requests}
+Priorities: {priorities}
+
+Provide:
+1. ALLOCATION: [Specific allocation per request]
+2. RATIONALE: [Why allocated this way]
+3. TRADE_OFFS: [What had to be sacrificed]
+4. CONTINGENCY: [Backup plans if needs change]
+"""
+
+
 class CEOOrchestrator(BaseAgent):
     """CEO agent for executive orchestration."""
 
+    __slots__ = ("priorities", "team_status")
+
+    ACTIONS = {
+        "prioritize": "_prioritize",
+        "coordinate_meeting": "_coordinate_meeting",
+        "resolve_conflict": "_resolve_conflict",
+        "propose_decision": "_propose_decision",
+        "allocate_resources": "_allocate_resources",
+    }
+    PARALLEL_SAFE_ACTIONS = frozenset(ACTIONS)
+
     def __init__(self, llm_client=None, name: str = "CEO"):
         super().__init__(
             role="CEO",
@@ -41,20 +116,7 @@ class CEOOrchestrator(BaseAgent):
 
     async def act(self, task: dict[str, Any]) -> dict[str, Any]:
         """Execute a CEO task."""
-        action = task.get("action")
-
-        if action == "prioritize":
-            return await self._prioritize(task)
-        elif action == "coordinate_meeting":
-            return await self._coordinate_meeting(task)
-        elif action == "resolve_conflict":
-            return await self._resolve_conflict(task)
-        elif action == "propose_decision":
-            return await self._propose_decision(task)
-        elif action == "allocate_resources":
-            return await self._allocate_resources(task)
-        else:
-            return {"error": f"Unknown action: {action}"}
+        return await self._dispatch(task)
 
     async def _prioritize(self, task: dict[str, Any]) -> dict[str, Any]:
         """Prioritize initiatives based on strategy and constraints."""
@@ -62,18 +124,11 @@ class CEOOrchestrator(BaseAgent):
         strategy = task.get("strategy", "")
         constraints = task.get("constraints", {})
 
-        prompt = f"""Prioritize the following initiatives:
-
-Strategy: {strategy}
-Constraints: {constraints}
-Initiatives: {initiatives}
-
-Provide:
-1. RANKED_LIST: [Ordered by priority with rationale]
-2. RESOURCE_ALLOCATION: [How to distribute resources]
-3. DEPENDENCIES: [Key dependencies between initiatives]
-4. TIMELINE: [Suggested sequence and timing]
-"""
+        prompt = _PRIORITIZE_TEMPLATE.format(
+            strategy=strategy,
+            constraints=constraints,
+            initiatives=initiatives,
+        )
         response = await self.think(prompt)
         self.add_thought("Prioritized initiatives")
 
@@ -88,16 +143,11 @@ Provide:
         participants = task.get("participants", [])
         agenda = task.get("agenda", [])
 
-        prompt = f"""Coordinate a {meeting_type} meeting with participants: {participants}
-
-Agenda items: {agenda}
-
-Provide:
-1. MEETING_STRUCTURE: [How to run the meeting efficiently]
-2. KEY_QUESTIONS: [Critical questions to address]
-3. DECISION_POINTS: [What needs to be decided]
-4. EXPECTED_OUTCOMES: [What should be achieved]
-"""
+        prompt = _COORDINATE_MEETING_TEMPLATE.format(
+            meeting_type=meeting_type,
+            participants=participants,
+            agenda=agenda,
+        )
         response = await self.think(prompt)
         self.add_thought(f"Coordinated {meeting_type} meeting")
 
@@ -112,17 +162,7 @@ Provide:
         conflict = task.get("conflict", {})
         parties = task.get("parties", [])
 
-        prompt = f"""Resolve the following conflict:
-
-Parties involved: {parties}
-Conflict description: {conflict}
-
-Provide:
-1. ROOT_CAUSE: [Underlying issue]
-2. OPTIONS: [Possible resolutions]
-3. RECOMMENDATION: [Best path forward with rationale]
-4. NEXT_STEPS: [Specific actions for each party]
-"""
+        prompt = _RESOLVE_CONFLICT_TEMPLATE.format(parties=parties, conflict=conflict)
         response = await self.think(prompt)
         self.add_thought("Resolved conflict")
 
@@ -137,19 +177,7 @@ Provide:
         options = task.get("options", [])
         context = task.get("context", {})
 
-        prompt = f"""Propose a decision on: {topic}
-
-Options considered: {options}
-Context: {context}
-
-Provide a formal decision proposal with:
-1. TITLE: [Clear decision statement]
-2. DESCRIPTION: [What is being decided]
-3. RATIONALE: [Why this is the right choice]
-4. ALTERNATIVES: [Other options and why rejected]
-5. EXPECTED_OUTCOMES: [What will happen if approved]
-6. RISKS: [Potential downsides and mitigations]
-"""
+        prompt = _PROPOSE_DECISION_TEMPLATE.format(topic=topic, options=options, context=context)
         response = await self.think(prompt)
         self.add_thought(f"Proposed decision: {topic}")
 
@@ -165,18 +193,11 @@ Provide a formal decision proposal with:
         requests = task.get("requests", [])
         priorities = task.get("priorities", [])
 
-        prompt = f"""Allocate resources:
-
-Available: {available}
-Requests: {requests}
-Priorities: {priorities}
-
-Provide:
-1. ALLOCATION: [Specific allocation per request]
-2. RATIONALE: [Why allocated this way]
-3. TRADE_OFFS: [What had to be sacrificed]
-4. CONTINGENCY: [Backup plans if needs change]
-"""
+        prompt = _ALLOCATE_RESOURCES_TEMPLATE.format(
+            available=available,
+            requests=requests,
+            priorities=priorities,
+        )
         response = await self.think(prompt)
         self.add_thought("Allocated resources")
 
@@ -3,6 +3,7 @@
 from typing import Any
 
 from core.agents.base import BaseAgent
+from core.agents.render import render_context
 
 
 ENGINEERING_SYSTEM_PROMPT = """You are an Engineering Expert in a virtual company.
@@ -25,9 +26,75 @@ When working on engineering:
 Be practical, thorough, and solution-oriented."""
 
 
+_DESIGN_ARCHITECTURE_TEMPLATE = """Design technical architecture for:
+
+Requirements: {requirements}
+Constraints: {constraints}
+
+Provide:
+1. HIGH_LEVEL_DESIGN: [System components and interactions]
+2. TECH_STACK: [Recommended technologies with rationale]
+3. DATA_MODEL: [Key entities and relationships]
+4. API_DESIGN: [Key interfaces]
+5. SECURITY_CONSIDERATIONS: [Authentication, authorization, data protection]
+6. SCALABILITY_APPROACH: [How to handle growth]
+7. TRADE_OFFS: [Key decisions and alternatives considered]
+"""
+
+_ESTIMATE_EFFORT_TEMPLATE = """Estimate effort for:
+
+Scope: {scope}
+Team capacity: {team_capacity}
+
+Provide:
+1. BREAKDOWN: [Tasks/subtasks with individual estimates]
+2. TOTAL_EFFORT: [In person-days or story points]
+3. TIMELINE: [Calendar time with parallelization]
+4. UNCERTAINTY: [Confidence level and risk factors]
+5. ASSUMPTIONS: [What the estimate assumes]
+6. BUFFER: [Recommended contingency]
+"""
+
+_TECHNICAL_REVIEW_TEMPLATE = """Review the following {review_type}:
+
+{artifact}
+
+Provide:
+1. STRENGTHS: [What's done well]
+2. CONCERNS: [Issues or risks]
+3. SUGGESTIONS: [Specific improvements]
+4. QUESTIONS: [What needs clarification]
+5. APPROVAL_STATUS: [APPROVE / APPROVE_WITH_CHANGES / REQUEST_CHANGES]
+6. PRIORITY_FIXES: [Must-fix issues if any]
+"""
+
+_IMPLEMENTATION_PLAN_TEMPLATE = """Create implementation plan for: {feature}
+
+Architecture: {architecture}
+
+Provide:
+1. MILESTONES: [Key deliverables with dates]
+2. TASKS: [Detailed task breakdown]
+3. DEPENDENCIES: [What must be done first]
+4. RISKS: [What could go wrong]
+5. MITIGATION: [How to handle risks]
+6. DEFINITION_OF_DONE: [When is it complete]
+7. TESTING_STRATEGY: [How to verify quality]
+"""
+
+
 class EngineeringExpert(BaseAgent):
     """Engineering expert agent."""
 
+    __slots__ = ()
+
+    ACTIONS = {
+        "design_architecture": "_design_architecture",
+        "estimate_effort": "_estimate_effort",
+        "technical_review": "_technical_review",
+        "implementation_plan": "_implementation_plan",
+    }
+
     def __init__(self, llm_client=None, name: str = "Engineering Expert"):
         super().__init__(
             role="Engineering",
@@ -38,38 +105,17 @@ class EngineeringExpert(BaseAgent):
 
     async def act(self, task: dict[str, Any]) -> dict[str, Any]:
         """Execute an engineering task."""
-        action = task.get("action")
-
-        if action == "design_architecture":
-            return await self._design_architecture(task)
-        elif action == "estimate_effort":
-            return await self._estimate_effort(task)
-        elif action == "technical_review":
-            return await self._technical_review(task)
-        elif action == "implementation_plan":
-            return await self._implementation_plan(task)
-        else:
-            return {"error": f"Unknown action: {action}"}
+        return await self._dispatch(task)
 
     async def _design_architecture(self, task: dict[str, Any]) -> dict[str, Any]:
         """Design technical architecture."""
         requirements = task.get("requirements", {})
         constraints = task.get("constraints", {})
 
-        prompt = f"""Design technical architecture for:
-
-Requirements: {requirements}
-Constraints: {constraints}
-
-Provide:
-1. HIGH_LEVEL_DESIGN: [System components and interactions]
-2. TECH_STACK: [Recommended technologies with rationale]
-3. DATA_MODEL: [Key entities and relationships]
-4. API_DESIGN: [Key interfaces]
-5. SECURITY_CONSIDERATIONS: [Authentication, authorization, data protection]
-6. SCALABILITY_APPROACH: [How to handle growth]
-7. TRADE_OFFS: [Key decisions and alternatives considered]
-"""
+        prompt = _DESIGN_ARCHITECTURE_TEMPLATE.format(
+            requirements=render_context(requirements),
+            constraints=render_context(constraints),
+        )
         response = await self.think(prompt)
         self.add_thought("Designed architecture")
 
@@ -83,19 +129,10 @@ Provide:
         scope = task.get("scope", {})
         team_capacity = task.get("team_capacity", {})
 
-        prompt = f"""Estimate effort for:
-
-Scope: {scope}
-Team capacity: {team_capacity}
-
-Provide:
-1. BREAKDOWN: [Tasks/subtasks with individual estimates]
-2. TOTAL_EFFORT: [In person-days or story points]
-3. TIMELINE: [Calendar time with parallelization]
-4. UNCERTAINTY: [Confidence level and risk factors]
-5. ASSUMPTIONS: [What the estimate assumes]
-6. BUFFER: [Recommended contingency]
-"""
+        prompt = _ESTIMATE_EFFORT_TEMPLATE.format(
+            scope=render_context(scope),
+            team_capacity=render_context(team_capacity),
+        )
         response = await self.think(prompt)
         self.add_thought("Estimated effort")
 
@@ -109,18 +146,10 @@ Provide:
         artifact = task.get("artifact", "")
         review_type = task.get("review_type", "design")
 
-        prompt = f"""Review the following {review_type}:
-
-{artifact}
-
-Provide:
-1. STRENGTHS: [What's done well]
-2. CONCERNS: [Issues or risks]
-3. SUGGESTIONS: [Specific improvements]
-4. QUESTIONS: [What needs clarification]
-5. APPROVAL_STATUS: [APPROVE / APPROVE_WITH_CHANGES / REQUEST_CHANGES]
-6. PRIORITY_FIXES: [Must-fix issues if any]
-"""
+        prompt = _TECHNICAL_REVIEW_TEMPLATE.format(
+            review_type=review_type,
+            artifact=render_context(artifact),
+        )
         response = await self.think(prompt)
         self.add_thought(f"Reviewed {review_type}")
 
@@ -135,19 +164,10 @@ Provide:
         feature = task.get("feature", "")
         architecture = task.get("architecture", {})
 
-        prompt = f"""Create implementation plan for: {feature}
-
-Architecture: {architecture}
-
-Provide:
-1. MILESTONES: [Key deliverables with dates]
-2. TASKS: [Detailed task breakdown]
-3. DEPENDENCIES: [What must be done first]
-4. RISKS: [What could go wrong]
-5. MITIGATION: [How to handle risks]
-6. DEFINITION_OF_DONE: [When is it complete]
-7. TESTING_STRATEGY: [How to verify quality]
-"""
+        prompt = _IMPLEMENTATION_PLAN_TEMPLATE.format(
+            feature=feature,
+            architecture=render_context(architecture),
+        )
         response = await self.think(prompt)
         self.add_thought(f"Created implementation plan for: {feature}")
 
@@ -25,9 +25,78 @@ When working on product:
 Be user-centric, analytical, and pragmatic."""
 
 
+_DEFINE_VISION_TEMPLATE = """Define product vision and strategy:
+
+Market: {market}
+Context: {context}
+
+Provide:
+1. VISION_STATEMENT: [Inspiring, clear vision]
+2. TARGET_USERS: [Who we serve]
+3. KEY_PROBLEMS: [Problems we solve]
+4. UNIQUE_VALUE: [Why choose us]
+5. SUCCESS_METRICS: [How we measure success]
+6. STRATEGIC_PILLARS: [3-5 core strategic areas]
+"""
+
+_PRIORITIZE_FEATURES_TEMPLATE = """Prioritize the following features:
+
+Strategy: {strategy}
+Constraints: {constraints}
+Features: {features}
+
+Provide:
+1. PRIORITIZED_LIST: [Ranked by RICE or similar framework]
+2. RATIONALE: [Why each priority level]
+3. QUICK_WINS: [High value, low effort]
+4. MAJOR_BETS: [High value, high effort]
+5. DEPRECATE: [Low value features to remove]
+6. ROADMAP: [Suggested sequence over quarters]
+"""
+
+_WRITE_PRD_TEMPLATE = """Write a PRD for: {feature}
+
+Context: {context}
+
+Include:
+1. OVERVIEW: [What and why]
+2. OBJECTIVES: [What success looks like]
+3. USER_STORIES: [As a [user], I want [goal], so that [benefit]]
+4. ACCEPTANCE_CRITERIA: [Specific, testable criteria]
+5. FUNCTIONAL_REQUIREMENTS: [What the feature does]
+6. NON_FUNCTIONAL_REQUIREMENTS: [Performance, security, etc.]
+7. OPEN_QUESTIONS: [What needs clarification]
+8. SUCCESS_METRICS: [How to measure impact]
+"""
+
+_USER_RESEARCH_TEMPLATE = """Analyze user research:
+
+User segments: {user_segments}
+Feedback/data: {feedback}
+
+Provide:
+1. KEY_INSIGHTS: [Most important findings]
+2. PAIN_POINTS: [Major user frustrations]
+3. DELIGHTERS: [What users love]
+4. UNMET_NEEDS: [Opportunities]
+5. SEGMENT_DIFFERENCES: [How needs vary by segment]
+6. PRODUCT_IMPLICATIONS: [What to build/change]
+"""
+
+
 class ProductExpert(BaseAgent):
     """Product expert agent."""
 
+    __slots__ = ()
+
+    ACTIONS = {
+        "define_vision": "_define_vision",
+        "prioritize_features": "_prioritize_features",
+        "write_prd": "_write_prd",
+        "user_research": "_user_research",
+    }
+    PARALLEL_SAFE_ACTIONS = frozenset(ACTIONS)
+
     def __init__(self, llm_client=None, name: str = "Product Expert"):
         super().__init__(
             role="Product",
@@ -38,37 +107,14 @@ class ProductExpert(BaseAgent):
 
     async def act(self, task: dict[str, Any]) -> dict[str, Any]:
         """Execute a product task."""
-        action = task.get("action")
-
-        if action == "define_vision":
-            return await self._define_vision(task)
-        elif action == "prioritize_features":
-            return await self._prioritize_features(task)
-        elif action == "write_prd":
-            return await self._write_prd(task)
-        elif action == "user_research":
-            return await self._user_research(task)
-        else:
-            return {"error": f"Unknown action: {action}"}
+        return await self._dispatch(task)
 
     async def _define_vision(self, task: dict[str, Any]) -> dict[str, Any]:
         """Define product vision and strategy."""
         context = task.get("context", {})
         market = task.get("market", "")
 
-        prompt = f"""Define product vision and strategy:
-
-Market: {market}
-Context: {context}
-
-Provide:
-1. VISION_STATEMENT: [Inspiring, clear vision]
-2. TARGET_USERS: [Who we serve]
-3. KEY_PROBLEMS: [Problems we solve]
-4. UNIQUE_VALUE: [Why choose us]
-5. SUCCESS_METRICS: [How we measure success]
-6. STRATEGIC_PILLARS: [3-5 core strategic areas]
-"""
+        prompt = _DEFINE_VISION_TEMPLATE.format(market=market, context=context)
         response = await self.think(prompt)
         self.add_thought("Defined product vision")
 
@@ -83,20 +129,11 @@ Provide:
         strategy = task.get("strategy", "")
         constraints = task.get("constraints", {})
 
-        prompt = f"""Prioritize the following features:
-
-Strategy: {strategy}
-Constraints: {constraints}
-Features: {features}
-
-Provide:
-1. PRIORITIZED_LIST: [Ranked by RICE or similar framework]
-2. RATIONALE: [Why each priority level]
-3. QUICK_WINS: [High value, low effort]
-4. MAJOR_BETS: [High value, high effort]
-5. DEPRECATE: [Low value features to remove]
-6. ROADMAP: [Suggested sequence over quarters]
-"""
+        prompt = _PRIORITIZE_FEATURES_TEMPLATE.format(
+            strategy=strategy,
+            constraints=constraints,
+            features=features,
+        )
         response = await self.think(prompt)
         self.add_thought("Prioritized features")
 
@@ -110,20 +147,7 @@ Provide:
         feature = task.get("feature", "")
         context = task.get("context", {})
 
-        prompt = f"""Write a PRD for: {feature}
-
-Context: {context}
-
-Include:
-1. OVERVIEW: [What and why]
-2. OBJECTIVES: [What success looks like]
-3. USER_STORIES: [As a [user], I want [goal], so that [benefit]]
-4. ACCEPTANCE_CRITERIA: [Specific, testable criteria]
-5. FUNCTIONAL_REQUIREMENTS: [What the feature does]
-6. NON_FUNCTIONAL_REQUIREMENTS: [Performance, security, etc.]
-7. OPEN_QUESTIONS: [What needs clarification]
-8. SUCCESS_METRICS: [How to measure impact]
-"""
+        prompt = _WRITE_PRD_TEMPLATE.format(feature=feature, context=context)
         response = await self.think(prompt)
         self.add_thought(f"Wrote PRD for: {feature}")
 
@@ -138,19 +162,7 @@ Include:
         feedback = task.get("feedback", [])
         user_segments = task.get("user_segments", [])
 
-        prompt = f"""Analyze user research:
-
-User segments: {user_segments}
-Feedback/data: {feedback}
-
-Provide:
-1. KEY_INSIGHTS: [Most important findings]
-2. PAIN_POINTS: [Major user frustrations]
-3. DELIGHTERS: [What users love]
-4. UNMET_NEEDS: [Opportunities]
-5. SEGMENT_DIFFERENCES: [How needs vary by segment]
-6. PRODUCT_IMPLICATIONS: [What to build/change]
-"""
+        prompt = _USER_RESEARCH_TEMPLATE.format(user_segments=user_segments, feedback=feedback)
         response = await self.think(prompt)
         self.add_thought("Analyzed user research")
 
@@ -25,9 +25,74 @@ When analyzing:
 Be thorough, analytical, and forward-looking."""
 
 
+_MARKET_ANALYSIS_TEMPLATE = """Analyze the following market:
+
+Market: {market}
+Context: {context}
+
+Provide:
+1. MARKET_SIZE: [TAM, SAM, SOM if available]
+2. GROWTH_TRENDS: [Key trends and drivers]
+3. CUSTOMER_SEGMENTS: [Important segments]
+4. OPPORTUNITIES: [Where to focus]
+5. THREATS: [Risks to monitor]
+6. RECOMMENDATIONS: [Strategic implications]
+"""
+
+_COMPETITIVE_ANALYSIS_TEMPLATE = """Analyze the competitive landscape:
+
+Our position: {our_position}
+Key competitors: {competitors}
+
+Provide:
+1. COMPETITOR_MAP: [Positioning of each competitor]
+2. OUR_ADVANTAGES: [What we do better]
+3. OUR_GAPS: [Where we lag]
+4. DIFFERENTIATION: [How to stand out]
+5. COMPETITIVE_THREATS: [Moves to watch]
+6. STRATEGIC_RESPONSE: [How to compete effectively]
+"""
+
+_SCENARIO_PLANNING_TEMPLATE = """Develop scenario plans for: {topic}
+Time horizon: {time_horizon}
+
+Provide:
+1. BASE_CASE: [Most likely scenario]
+2. BEST_CASE: [Optimistic but plausible]
+3. WORST_CASE: [Pessimistic but plausible]
+4. WILD_CARD: [Low probability, high impact]
+5. INDICATORS: [Signals to watch for each scenario]
+6. CONTINGENCY_PLANS: [How to prepare for each]
+"""
+
+_STRATEGIC_OPTIONS_TEMPLATE = """Develop strategic options for:
+
+Objective: {objective}
+Constraints: {constraints}
+
+Provide:
+1. OPTION_A: [Description, pros, cons, resource needs]
+2. OPTION_B: [Description, pros, cons, resource needs]
+3. OPTION_C: [Description, pros, cons, resource needs]
+4. COMPARISON: [Side-by-side comparison]
+5. RECOMMENDATION: [Best option with rationale]
+6. IMPLEMENTATION: [Key steps if chosen]
+"""
+
+
 class StrategyExpert(BaseAgent):
     """Strategy expert agent."""
 
+    __slots__ = ()
+
+    ACTIONS = {
+        "market_analysis": "_market_analysis",
+        "competitive_analysis": "_competitive_analysis",
+        "scenario_planning": "_scenario_planning",
+        "strategic_options": "_strategic_options",
+    }
+    PARALLEL_SAFE_ACTIONS = frozenset(ACTIONS)
+
     def __init__(self, llm_client=None, name: str = "Strategy Expert"):
         super().__init__(
             role="Strategy",
@@ -38,37 +103,14 @@ class StrategyExpert(BaseAgent):
 
     async def act(self, task: dict[str, Any]) -> dict[str, Any]:
         """Execute a strategy task."""
-        action = task.get("action")
-
-        if action == "market_analysis":
-            return await self._market_analysis(task)
-        elif action == "competitive_analysis":
-            return await self._competitive_analysis(task)
-        elif action == "scenario_planning":
-            return await self._scenario_planning(task)
-        elif action == "strategic_options":
-            return await self._strategic_options(task)
-        else:
-            return {"error": f"Unknown action: {action}"}
+        return await self._dispatch(task)
 
     async def _market_analysis(self, task: dict[str, Any]) -> dict[str, Any]:
         """Analyze market trends and opportunities."""
         market = task.get("market", "")
         context = task.get("context", {})
 
-        prompt = f"""Analyze the following market:
-
-Market: {market}
-Context: {context}
-
-Provide:
-1. MARKET_SIZE: [TAM, SAM, SOM if available]
-2. GROWTH_TRENDS: [Key trends and drivers]
-3. CUSTOMER_SEGMENTS: [Important segments]
-4. OPPORTUNITIES: [Where to focus]
-5. THREATS: [Risks to monitor]
-6. RECOMMENDATIONS: [Strategic implications]
-"""
+        prompt = _MARKET_ANALYSIS_TEMPLATE.format(market=market, context=context)
         response = await self.think(prompt)
         self.add_thought(f"Analyzed market: {market}")
 
@@ -83,19 +125,10 @@ Provide:
         competitors = task.get("competitors", [])
         our_position = task.get("our_position", {})
 
-        prompt = f"""Analyze the competitive landscape:
-
-Our position: {our_position}
-Key competitors: {competitors}
-
-Provide:
-1. COMPETITOR_MAP: [Positioning of each competitor]
-2. OUR_ADVANTAGES: [What we do better]
-3. OUR_GAPS: [Where we lag]
-4. DIFFERENTIATION: [How to stand out]
-5. COMPETITIVE_THREATS: [Moves to watch]
-6. STRATEGIC_RESPONSE: [How to compete effectively]
-"""
+        prompt = _COMPETITIVE_ANALYSIS_TEMPLATE.format(
+            our_position=our_position,
+            competitors=competitors,
+        )
         response = await self.think(prompt)
         self.add_thought("Analyzed competitive landscape")
 
@@ -109,17 +142,7 @@ Provide:
         topic = task.get("topic", "")
         time_horizon = task.get("time_horizon", "3 years")
 
-        prompt = f"""Develop scenario plans for: {topic}
-Time horizon: {time_horizon}
-
-Provide:
-1. BASE_CASE: [Most likely scenario]
-2. BEST_CASE: [Optimistic but plausible]
-3. WORST_CASE: [Pessimistic but plausible]
-4. WILD_CARD: [Low probability, high impact]
-5. INDICATORS: [Signals to watch for each scenario]
-6. CONTINGENCY_PLANS: [How to prepare for each]
-"""
+        prompt = _SCENARIO_PLANNING_TEMPLATE.format(topic=topic, time_horizon=time_horizon)
         response = await self.think(prompt)
         self.add_thought(f"Developed scenarios for: {topic}")
 
@@ -134,19 +157,7 @@ Provide:
         objective = task.get("objective", "")
         constraints = task.get("constraints", {})
 
-        prompt = f"""Develop strategic options for:
-
-Objective: {objective}
-Constraints: {constraints}
-
-Provide:
-1. OPTION_A: [Description, pros, cons, resource needs]
-2. OPTION_B: [Description, pros, cons, resource needs]
-3. OPTION_C: [Description, pros, cons, resource needs]
-4. COMPARISON: [Side-by-side comparison]
-5. RECOMMENDATION: [Best option with rationale]
-6. IMPLEMENTATION: [Key steps if chosen]
-"""
+        prompt = _STRATEGIC_OPTIONS_TEMPLATE.format(objective=objective, constraints=constraints)
         response = await self.think(prompt)
         self.add_thought(f"Generated strategic options for: {objective}")
 
@@ -0,0 +1,18 @@
+"""Rendering of task payloads into prompt text."""
+
+import json
+from typing import Any
+
+# Default cap on characters a single payload may contribute to a prompt
+MAX_CONTEXT_CHARS = 2000
+
+
+def render_context(obj: Any, max_chars: int = MAX_CONTEXT_CHARS) -> str:
+    """Render a task payload as compact text, truncated to ``max_chars``.
+
+    Strings are used as-is; other values are serialized as JSON.
+    """
+    text = obj if isinstance(obj, str) else json.dumps(obj, ensure_ascii=False, default=str)
+    if len(text) <= max_chars:
+        return text
+    return f"{text[:max_chars]}...<truncated {len(text) - max_chars} chars>"
@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class DecisionStatus(str, Enum):
@@ -45,6 +45,10 @@ class MeetingPhase(str, Enum):
 class Decision(BaseModel):
     """A decision made in the organization."""
 
+    # DecisionRegistry hands out its cached instances, so they are read-only;
+    # change one with model_copy(update=...) and save the copy
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Unique identifier")
     title: str = Field(..., description="Decision title")
     description: str = Field(..., description="Detailed description")
@@ -117,6 +121,9 @@ class AgentThought(BaseModel):
 class WorkspaceSnapshot(BaseModel):
     """Snapshot of the entire workspace state."""
 
+    # Snapshots are read-only views; freezing lets them be shared safely
+    model_config = ConfigDict(frozen=True)
+
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     active_initiatives: list[Initiative] = Field(default_factory=list)
     pending_decisions: list[Decision] = Field(default_factory=list)
@@ -1,6 +1,10 @@
 """Decision registry for tracking and querying decisions."""
 
+import heapq
+import threading
+from collections import defaultdict
 from datetime import datetime
+from operator import attrgetter
 from typing import Any
 
 from .models import Decision, DecisionStatus
@@ -8,18 +12,60 @@ from .store import ArtifactStore
 
 
 class DecisionRegistry:
-    """Registry for managing decisions."""
+    """Registry for managing decisions.
+
+    Decisions returned by ``get`` and the ``list_*`` methods are the cached
+    instances themselves; Decision is frozen so they cannot be changed behind
+    the registry's back.
+    """
 
     def __init__(self, store: ArtifactStore | None = None):
         self.store = store or ArtifactStore()
+        # In-memory copy of all decisions, valid while the store version matches
+        self._lock = threading.Lock()
+        self._cache: dict[str, Decision] | None = None
+        self._cache_version = -1
+        self._by_status: defaultdict[DecisionStatus, set[str]] = defaultdict(set)
+
+    def _refresh(self) -> dict[str, Decision]:
+        """Reload the cache if decisions were written elsewhere (hold the lock)."""
+        version = self.store.version("decision")
+        if self._cache is None or self._cache_version != version:
+            self._cache = {d.id: d for d in self.store.list_all("decision", Decision)}
+            self._cache_version = version
+            self._by_status = defaultdict(set)
+            for d in self._cache.values():
+                self._by_status[d.status].add(d.id)
+        return self._cache
+
+    def _decisions(self) -> dict[str, Decision]:
+        """Get all decisions by ID."""
+        with self._lock:
+            return self._refresh()
+
+    def _save(self, decision: Decision) -> None:
+        """Persist a decision, then update the cache and status index.
+
+        Nothing in memory changes unless the write succeeds.
+        """
+        with self._lock:
+            fresh = self._cache is not None and self._cache_version == self.store.version("decision")
+            self.store.save("decision", decision.id, decision)
+            if fresh:
+                previous = self._cache.get(decision.id)
+                if previous is not None:
+                    self._by_status[previous.status].discard(decision.id)
+                self._cache[decision.id] = decision
+                self._cache_version = self.store.version("decision")
+                self._by_status[decision.status].add(decision.id)
 
     def register(self, decision: Decision) -> None:
         """Register a new decision."""
-        self.store.save("decision", decision.id, decision)
+        self._save(decision)
 
     def get(self, decision_id: str) -> Decision | None:
         """Get a decision by ID."""
-        return self.store.load("decision", decision_id, Decision)
+        return self._decisions().get(decision_id)
 
     def update_status(
         self,
@@ -32,22 +78,31 @@ class DecisionRegistry:
         if not decision:
             return None
 
-        decision.status = status
-        decision.updated_at = datetime.utcnow()
+        update: dict[str, Any] = {"status": status, "updated_at": datetime.utcnow()}
         if approved_by:
-            decision.approved_by = approved_by
+            update["approved_by"] = approved_by
+        decision = decision.model_copy(update=update)
 
-        self.store.save("decision", decision.id, decision)
+        self._save(decision)
         return decision
 
     def list_all(self) -> list[Decision]:
         """List all decisions."""
-        return self.store.list_all("decision", Decision)
+        return list(self._decisions().values())
+
+    def list_recent(self, limit: int = 5) -> list[Decision]:
+        """List the most recently created decisions, newest first."""
+        return heapq.nlargest(limit, self._decisions().values(), key=attrgetter("created_at"))
+
+    def count(self) -> int:
+        """Count all decisions."""
+        return len(self._decisions())
 
     def list_by_status(self, status: DecisionStatus) -> list[Decision]:
         """List decisions by status."""
-        all_decisions = self.list_all()
-        return [d for d in all_decisions if d.status == status]
+        with self._lock:
+            decisions = self._refresh()
+            return [decisions[i] for i in self._by_status.get(status, ())]
 
     def list_pending(self) -> list[Decision]:
         """List pending decisions."""
@@ -63,24 +118,24 @@ class DecisionRegistry:
 
     def get_metrics(self) -> dict[str, Any]:
         """Get decision metrics."""
-        all_decisions = self.list_all()
-        if not all_decisions:
+        with self._lock:
+            self._refresh()
+            by_status = {status: len(ids) for status, ids in self._by_status.items() if ids}
+
+        total = sum(by_status.values())
+        if not total:
             return {
                 "total": 0,
                 "by_status": {},
                 "approval_rate": 0.0,
             }
 
-        by_status = {}
-        for d in all_decisions:
-            by_status[d.status] = by_status.get(d.status, 0) + 1
-
         approved = by_status.get(DecisionStatus.APPROVED, 0)
         decided = approved + by_status.get(DecisionStatus.REJECTED, 0)
         approval_rate = approved / decided if decided > 0 else 0.0
 
         return {
-            "total": len(all_decisions),
+            "total": total,
             "by_status": by_status,
             "approval_rate": approval_rate,
         }
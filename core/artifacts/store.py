@@ -1,7 +1,9 @@
 """Artifact store for persisting artifacts to JSON files."""
 
-import json
+import asyncio
 import os
+import secrets
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TypeVar
 
@@ -9,6 +11,14 @@ from pydantic import BaseModel
 
 T = TypeVar("T", bound=BaseModel)
 
+# Directories with at least this many files are read on the thread pool
+PARALLEL_SCAN_THRESHOLD = 64
+
+_scan_executor = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4),
+    thread_name_prefix="artifact-scan",
+)
+
 
 class ArtifactStore:
     """File-based store for artifacts."""
@@ -33,57 +43,167 @@ class ArtifactStore:
         self.action_items_path = self.artifacts_path / "action_items"
         self.action_items_path.mkdir(exist_ok=True)
 
-    def _get_path(self, artifact_type: str, artifact_id: str) -> Path:
-        """Get the file path for an artifact."""
-        type_paths = {
+        self._type_paths = {
             "decision": self.decisions_path,
             "meeting": self.meetings_path,
             "initiative": self.initiatives_path,
             "action_item": self.action_items_path,
         }
-        path = type_paths.get(artifact_type, self.artifacts_path)
+
+        # Per-type write counters so readers can cache derived views
+        self._versions: dict[str, int] = {}
+
+    def _get_path(self, artifact_type: str, artifact_id: str) -> Path:
+        """Get the file path for an artifact."""
+        path = self._type_paths.get(artifact_type, self.artifacts_path)
         return path / f"{artifact_id}.json"
 
+    @staticmethod
+    def _read(file_path: str | Path) -> bytes:
+        """Read a whole file with one unbuffered read sized from fstat."""
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            return os.read(fd, os.fstat(fd).st_size)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _write(file_path: Path, payload: str, sync: bool = False) -> None:
+        """Write a file atomically via a temporary sibling and rename.
+
+        The temporary name is unique per write, so concurrent writes of the
+        same artifact (say, a batch on a worker thread and a route's save)
+        never share one; the last rename wins. With ``sync``, the data is
+        flushed to disk before the rename.
+        """
+        tmp_path = file_path.with_name(f".{file_path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            with open(tmp_path, "x", encoding="utf-8") as f:
+                f.write(payload)
+                if sync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _sync_dir(path: Path) -> None:
+        """Flush a directory's entries (such as a rename) to disk.
+
+        Windows cannot open directories, and its renames need no such flush.
+        """
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
     def save(self, artifact_type: str, artifact_id: str, data: BaseModel) -> None:
         """Save an artifact to disk."""
         file_path = self._get_path(artifact_type, artifact_id)
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data.model_dump(mode="json"), f, indent=2, ensure_ascii=False)
+        self._write(file_path, data.model_dump_json(indent=2))
+        self._bump(artifact_type)
+
+    def save_many(self, items: list[tuple[str, str, BaseModel]], sync: bool = False) -> None:
+        """Save several (artifact_type, artifact_id, data) artifacts at once.
+
+        Everything is serialized before any file is written. With ``sync``,
+        each file is flushed to disk before it replaces the old one, and the
+        directories holding them are flushed once at the end.
+        """
+        payloads = self._serialize_many(items)
+        self._write_many(payloads, sync)
+        self._bump_many(payloads)
+
+    async def asave_many(self, items: list[tuple[str, str, BaseModel]], sync: bool = False) -> None:
+        """Like save_many, but write the files on a worker thread.
+
+        Serialization stays on the calling thread; only the file I/O (and the
+        optional sync) is moved off the event loop.
+        """
+        payloads = self._serialize_many(items)
+        await asyncio.to_thread(self._write_many, payloads, sync)
+        self._bump_many(payloads)
+
+    def _serialize_many(self, items: list[tuple[str, str, BaseModel]]) -> list[tuple[str, Path, str]]:
+        """Serialize artifacts into (artifact_type, file_path, payload) triples."""
+        return [
+            (artifact_type, self._get_path(artifact_type, artifact_id), data.model_dump_json(indent=2))
+            for artifact_type, artifact_id, data in items
+        ]
+
+    def _write_many(self, payloads: list[tuple[str, Path, str]], sync: bool) -> None:
+        """Write serialized artifacts, optionally flushing them to disk."""
+        for _, file_path, payload in payloads:
+            self._write(file_path, payload, sync)
+        if sync:
+            for directory in {file_path.parent for _, file_path, _ in payloads}:
+                self._sync_dir(directory)
+
+    def _bump_many(self, payloads: list[tuple[str, Path, str]]) -> None:
+        """Record writes for every artifact type in a batch."""
+        for artifact_type in {artifact_type for artifact_type, _, _ in payloads}:
+            self._bump(artifact_type)
 
     def load(self, artifact_type: str, artifact_id: str, model_class: type[T]) -> T | None:
         """Load an artifact from disk."""
         file_path = self._get_path(artifact_type, artifact_id)
-        if not file_path.exists():
+        try:
+            raw = self._read(file_path)
+        except FileNotFoundError:
             return None
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return model_class.model_validate(data)
+        # Validated straight from the bytes: no intermediate dict is built,
+        # so large meeting logs cost the file size plus the model itself
+        return model_class.model_validate_json(raw)
 
     def list_all(self, artifact_type: str, model_class: type[T]) -> list[T]:
         """List all artifacts of a type."""
-        type_paths = {
-            "decision": self.decisions_path,
-            "meeting": self.meetings_path,
-            "initiative": self.initiatives_path,
-            "action_item": self.action_items_path,
-        }
-        path = type_paths.get(artifact_type, self.artifacts_path)
-        artifacts = []
-
-        if not path.exists():
-            return artifacts
-
-        for file_path in path.glob("*.json"):
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            artifacts.append(model_class.model_validate(data))
-
-        return artifacts
+        path = self._type_paths.get(artifact_type, self.artifacts_path)
+        try:
+            with os.scandir(path) as entries:
+                file_paths = [e.path for e in entries if e.name.endswith(".json") and e.is_file()]
+        except FileNotFoundError:
+            return []
+
+        def parse(file_path: str) -> T:
+            return model_class.model_validate_json(self._read(file_path))
+
+        if len(file_paths) < PARALLEL_SCAN_THRESHOLD:
+            return [parse(p) for p in file_paths]
+        # Overlap file reads (which release the GIL) across a thread pool
+        return list(_scan_executor.map(parse, file_paths))
+
+    def count(self, artifact_type: str) -> int:
+        """Count artifacts of a type without loading them."""
+        path = self._type_paths.get(artifact_type, self.artifacts_path)
+        try:
+            with os.scandir(path) as entries:
+                return sum(1 for e in entries if e.name.endswith(".json") and e.is_file())
+        except FileNotFoundError:
+            return 0
 
     def delete(self, artifact_type: str, artifact_id: str) -> bool:
         """Delete an artifact. Returns True if deleted, False if not found."""
         file_path = self._get_path(artifact_type, artifact_id)
         if file_path.exists():
             file_path.unlink()
+            self._bump(artifact_type)
             return True
         return False
+
+    def version(self, artifact_type: str) -> int:
+        """Get the write counter for an artifact type.
+
+        The counter increases on every save/delete of that type, so callers can
+        compare it against a remembered value to detect stale cached views.
+        """
+        return self._versions.get(artifact_type, 0)
+
+    def _bump(self, artifact_type: str) -> None:
+        """Record a write for an artifact type."""
+        self._versions[artifact_type] = self._versions.get(artifact_type, 0) + 1
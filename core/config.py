@@ -0,0 +1,31 @@
+"""Environment-derived settings for scripts and entry points."""
+
+import functools
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class Config:
+    """LLM settings read from the environment."""
+
+    openai_key: Optional[str]
+    anthropic_key: Optional[str]
+    base_url: Optional[str]
+    model: str
+
+
+@functools.lru_cache(maxsize=None)
+def get_config() -> Config:
+    """Read the settings once per process.
+
+    Call after the .env file is loaded; later changes to the environment
+    are not picked up.
+    """
+    return Config(
+        openai_key=os.environ.get("OPENAI_API_KEY"),
+        anthropic_key=os.environ.get("ANTHROPIC_API_KEY"),
+        base_url=os.environ.get("OPENAI_BASE_URL"),
+        model=os.environ.get("DEFAULT_MODEL", "kimi-k2.5"),
+    )
@@ -5,19 +5,39 @@ from typing import Any, AsyncIterator
 
 
 class LLMMessage:
-    """Represents a message in the conversation."""
+    """Represents a message in the conversation.
+
+    Messages are treated as immutable once converted: ``to_dict`` caches
+    its result so retries and provider fallbacks reuse it.
+    """
+
+    __slots__ = ("role", "content", "_dict")
 
     def __init__(self, role: str, content: str):
         self.role = role
         self.content = content
+        self._dict: dict[str, str] | None = None
 
     def to_dict(self) -> dict[str, str]:
-        return {"role": self.role, "content": self.content}
+        if self._dict is None:
+            self._dict = {"role": self.role, "content": self.content}
+        return self._dict
+
+
+# Messages may be LLMMessage objects or ready-made {"role", "content"} dicts
+MessageLike = LLMMessage | dict[str, str]
+
+
+def to_message_dicts(messages: list[MessageLike]) -> list[dict[str, str]]:
+    """Normalize messages to the dict form sent to provider APIs."""
+    return [m if isinstance(m, dict) else m.to_dict() for m in messages]
 
 
 class LLMResponse:
     """Standardized response from any LLM provider."""
 
+    __slots__ = ("content", "usage")
+
     def __init__(self, content: str, usage: dict[str, Any] | None = None):
         self.content = content
         self.usage = usage or {}
@@ -26,6 +46,8 @@ class LLMResponse:
 class LLMClient(ABC):
     """Abstract base class for LLM clients."""
 
+    __slots__ = ("model", "api_key")
+
     def __init__(self, model: str, api_key: str | None = None):
         self.model = model
         self.api_key = api_key
@@ -33,7 +55,7 @@ class LLMClient(ABC):
     @abstractmethod
     async def complete(
         self,
-        messages: list[LLMMessage],
+        messages: list[MessageLike],
         temperature: float = 0.7,
         max_tokens: int | None = None,
     ) -> LLMResponse:
@@ -43,9 +65,17 @@ class LLMClient(ABC):
     @abstractmethod
     async def stream(
         self,
-        messages: list[LLMMessage],
+        messages: list[MessageLike],
         temperature: float = 0.7,
         max_tokens: int | None = None,
     ) -> AsyncIterator[str]:
         """Stream response chunks."""
         pass
+
+    async def prewarm(self) -> None:
+        """Open a connection to the provider ahead of the first request."""
+        pass
+
+    async def close(self) -> None:
+        """Release network resources held by the client."""
+        pass
@@ -0,0 +1,210 @@
+"""Response cache for deterministic LLM calls."""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, AsyncIterator, Optional, Protocol
+
+from .base import LLMResponse, MessageLike, to_message_dicts
+
+
+class CacheBackend(Protocol):
+    """Storage for cached responses keyed by request hash."""
+
+    async def get(self, key: str) -> Optional[dict[str, Any]]: ...
+
+    async def set(self, key: str, value: dict[str, Any]) -> None: ...
+
+
+class MemoryCache:
+    """In-process LRU cache with an optional TTL."""
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self.ttl is not None and time.monotonic() - entry[0] > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+class FileCache:
+    """Cache persisted to a JSON file, so entries survive between runs.
+
+    The whole file is loaded on creation and rewritten atomically after
+    each set, which suits small caches such as demo and smoke-test replays.
+    Rewrites happen on a worker thread, and sets that arrive while one is in
+    progress are saved together by the next. Only the ``maxsize`` most
+    recently used entries are kept.
+    """
+
+    def __init__(self, path: str | Path, maxsize: int = 1024):
+        self.path = Path(path)
+        self.maxsize = maxsize
+        try:
+            self._entries: dict[str, dict[str, Any]] = json.loads(self.path.read_bytes())
+        except (FileNotFoundError, ValueError):
+            self._entries = {}
+        self._dirty = False
+        self._write_lock = asyncio.Lock()
+
+    async def get(self, key: str) -> Optional[dict[str, Any]]:
+        # Move hits to the end so recently used entries are evicted last
+        value = self._entries.pop(key, None)
+        if value is not None:
+            self._entries[key] = value
+        return value
+
+    async def set(self, key: str, value: dict[str, Any]) -> None:
+        self._entries.pop(key, None)
+        self._entries[key] = value
+        while len(self._entries) > self.maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._dirty = True
+        async with self._write_lock:
+            if self._dirty:
+                self._dirty = False
+                # Shallow copy: later sets may change the dict during the write
+                await asyncio.to_thread(self._write, dict(self._entries))
+
+    def _write(self, entries: dict[str, dict[str, Any]]) -> None:
+        """Replace the cache file with ``entries``."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(entries, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+
+class LLMCache:
+    """Caches completions for requests that are deterministic (temperature 0)."""
+
+    def __init__(self, backend: Optional[CacheBackend] = None):
+        self.backend = backend or MemoryCache()
+
+    @staticmethod
+    def cache_key(
+        provider_id: str,
+        model: str,
+        messages: list[MessageLike],
+        temperature: float,
+        max_tokens: Optional[int] = None,
+    ) -> Optional[str]:
+        """Hash a request into a cache key, or None if it is not cacheable."""
+        if temperature > 0:
+            return None
+        return LLMCache.request_key(provider_id, model, messages, temperature, max_tokens)
+
+    @staticmethod
+    def request_key(
+        provider_id: str,
+        model: str,
+        messages: list[MessageLike],
+        temperature: float,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """Hash a request into a cache key, whatever its temperature."""
+        payload = json.dumps(
+            [provider_id, model, to_message_dicts(messages), temperature, max_tokens],
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    async def get(self, key: str) -> Optional[LLMResponse]:
+        """Get a cached response."""
+        cached = await self.backend.get(key)
+        if cached is None:
+            return None
+        return LLMResponse(cached["content"], cached["usage"])
+
+    async def set(self, key: str, response: LLMResponse) -> None:
+        """Cache a response."""
+        await self.backend.set(key, {"content": response.content, "usage": response.usage})
+
+
+class CachedClient:
+    """Wraps an LLM client and replays responses to identical requests.
+
+    Unlike MultiClient's cache this ignores temperature: any repeated
+    request is answered from the cache. It is meant for demos and smoke
+    tests that send the same prompts on every run, not for production
+    traffic. A streamed response is cached once the stream completes and
+    replayed as a single chunk.
+    """
+
+    def __init__(self, client: Any, cache: Optional[LLMCache] = None):
+        self.client = client
+        self.cache = cache or LLMCache()
+
+    async def complete(
+        self,
+        messages: list[MessageLike],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Return the cached response for this request, or fetch and cache it."""
+        key = self._key(messages, temperature, max_tokens, kwargs)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return cached
+        response = await self.client.complete(messages, temperature, max_tokens, **kwargs)
+        await self.cache.set(key, response)
+        return response
+
+    async def stream(
+        self,
+        messages: list[MessageLike],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Replay the cached response for this request, or stream and cache it."""
+        key = self._key(messages, temperature, max_tokens, kwargs)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            yield cached.content
+            return
+        chunks = []
+        async for chunk in self.client.stream(messages, temperature, max_tokens, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        await self.cache.set(key, LLMResponse("".join(chunks)))
+
+    def _key(
+        self,
+        messages: list[MessageLike],
+        temperature: float,
+        max_tokens: Optional[int],
+        kwargs: dict[str, Any],
+    ) -> str:
+        return LLMCache.request_key(
+            kwargs.get("specific_provider") or "",
+            getattr(self.client, "model", ""),
+            messages,
+            temperature,
+            max_tokens,
+        )
+
+    async def prewarm(self) -> None:
+        await self.client.prewarm()
+
+    async def close(self) -> None:
+        await self.client.close()
@@ -3,29 +3,38 @@
 Deprecated: Use MultiClient instead for multi-provider support.
 """
 
+import functools
 import os
-from typing import Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 from .base import LLMClient
-from .multi_client import MultiClient
-from .providers.anthropic_client import AnthropicClient
-from .providers.openai_client import OpenAIClient
+from .provider_types import ProviderConfig, ProviderType
+from .providers import close_clients, get_client
 
+if TYPE_CHECKING:
+    from .multi_client import MultiClient
 
-# Load environment variables from .env file if exists
-try:
-    from pathlib import Path
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load variables from a local .env file once per process.
+
+    Existing environment variables take precedence over the file.
+    """
     env_path = Path(".env")
-    if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, value = line.split("=", 1)
-                    if key not in os.environ:
-                        os.environ[key] = value
-except Exception:
-    pass  # Silently fail if .env cannot be read
+    try:
+        lines = env_path.read_text(encoding="utf-8").splitlines()
+    except (OSError, UnicodeDecodeError):
+        return  # No .env file (or unreadable): rely on the environment
+
+    pairs = [
+        line.split("=", 1)
+        for line in map(str.strip, lines)
+        if line and not line.startswith("#") and "=" in line
+    ]
+    for key, value in pairs:
+        os.environ.setdefault(key, value)
 
 
 class LLMClientFactory:
@@ -40,7 +49,14 @@ class LLMClientFactory:
         model: Optional[str] = None,
         api_key: Optional[str] = None,
     ) -> LLMClient:
-        """Create an LLM client for the specified provider."""
+        """Create an LLM client for the specified provider.
+
+        Clients come from the shared provider registry, so repeated calls with
+        the same configuration (and MultiClient using the same provider) share
+        one client and its tuned connection pool. The call itself is not
+        memoized, so changed environment settings still take effect.
+        """
+        _load_env()
         provider = provider.lower()
 
         if provider == "openai":
@@ -49,19 +65,39 @@ class LLMClientFactory:
             base_url = os.getenv("OPENAI_BASE_URL")
             if not api_key:
                 raise ValueError("OpenAI API key required. Set OPENAI_API_KEY env var.")
-            return OpenAIClient(model=model, api_key=api_key, base_url=base_url)
+            return get_client(ProviderConfig(
+                id=provider,
+                name="OpenAI",
+                type=ProviderType.OPENAI,
+                api_key=api_key,
+                base_url=base_url,
+                default_model=model,
+            ))
 
         elif provider == "anthropic":
             model = model or "claude-3-5-sonnet-20241022"
             api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
             if not api_key:
                 raise ValueError("Anthropic API key required. Set ANTHROPIC_API_KEY env var.")
-            return AnthropicClient(model=model, api_key=api_key)
+            return get_client(ProviderConfig(
+                id=provider,
+                name="Anthropic",
+                type=ProviderType.ANTHROPIC,
+                api_key=api_key,
+                default_model=model,
+            ))
 
         else:
             raise ValueError(f"Unknown provider: {provider}. Supported: openai, anthropic")
 
     @staticmethod
-    def create_multi_client() -> MultiClient:
+    async def close_all() -> None:
+        """Close every shared client and release its connections."""
+        await close_clients()
+
+    @staticmethod
+    def create_multi_client() -> "MultiClient":
         """Create a MultiClient with auto-switch support."""
+        from .multi_client import MultiClient
+
         return MultiClient()
@@ -0,0 +1,55 @@
+"""Offline LLM client that answers from canned responses."""
+
+from typing import AsyncIterator, Mapping
+
+from .base import LLMClient, LLMResponse, MessageLike, to_message_dicts
+
+
+class MockLLMClient(LLMClient):
+    """LLM client for demos and tests that never touches the network.
+
+    ``responses`` maps a snippet of the final message to the reply for any
+    request whose final message contains it; the first matching snippet wins
+    and ``default`` answers everything else. Streaming yields the reply line
+    by line, so streamed and complete calls go through the same code paths
+    as with a real provider.
+    """
+
+    __slots__ = ("responses", "default")
+
+    def __init__(
+        self,
+        responses: Mapping[str, str] | None = None,
+        default: str = "This is a mock response.",
+        model: str = "mock",
+    ):
+        super().__init__(model)
+        self.responses = dict(responses or {})
+        self.default = default
+
+    def _reply(self, messages: list[MessageLike]) -> str:
+        """Pick the canned reply for a request."""
+        prompt = to_message_dicts(messages)[-1]["content"] if messages else ""
+        for snippet, reply in self.responses.items():
+            if snippet in prompt:
+                return reply
+        return self.default
+
+    async def complete(
+        self,
+        messages: list[MessageLike],
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+    ) -> LLMResponse:
+        """Return the canned reply for the request."""
+        return LLMResponse(self._reply(messages))
+
+    async def stream(
+        self,
+        messages: list[MessageLike],
+        temperature: float = 0.7,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[str]:
+        """Yield the canned reply one line at a time."""
+        for line in self._reply(messages).splitlines(keepends=True):
+            yield line
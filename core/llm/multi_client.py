@@ -1,14 +1,29 @@
 """Multi-provider LLM client with auto-switch capability."""
 
 import asyncio
+import logging
+import random
 import time
 from typing import AsyncIterator, Optional
 
-from .base import LLMClient, LLMMessage, LLMResponse
+from .base import LLMClient, LLMMessage, LLMResponse, MessageLike, to_message_dicts
+from .cache import LLMCache
 from .provider_manager import ProviderManager
-from .provider_types import ProviderConfig, ProviderType
-from .providers.anthropic_client import AnthropicClient
-from .providers.openai_client import OpenAIClient
+from .provider_types import ProviderConfig
+from .rate_limit import classify_error, estimate_tokens, is_retryable, retry_after
+from .streaming import buffered
+from .providers import close_clients, get_client
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on a single provider health check, in seconds
+PROBE_TIMEOUT = 10.0
+
+# How long a provider health result stays valid, in seconds
+HEALTH_TTL = 60.0
+
+# Ceiling for exponential retry backoff, in seconds
+MAX_BACKOFF = 30.0
 
 
 class MultiClientError(Exception):
@@ -22,38 +37,141 @@ class MultiClientError(Exception):
 class MultiClient:
     """LLM client that tries multiple providers with auto-switch."""
 
-    def __init__(self, provider_manager: Optional[ProviderManager] = None):
+    def __init__(
+        self,
+        provider_manager: Optional[ProviderManager] = None,
+        cache: Optional[LLMCache] = None,
+    ):
         self.provider_manager = provider_manager or ProviderManager()
+        self.cache = cache or LLMCache()
         self._current_provider_idx = 0
+        # provider_id -> (checked_at, config it was checked with, success, message)
+        self._health: dict[str, tuple[float, tuple, bool, str]] = {}
+
+    async def __aenter__(self) -> "MultiClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def model(self) -> str:
+        """The enabled providers and their models in fallback order.
+
+        Response caches keyed on a client's model (CachedClient, meeting
+        response caches) use this, so a change to the provider order or to a
+        provider's model no longer replays answers from the old setup.
+        """
+        return ",".join(
+            f"{p.id}:{p.default_model}" for p in self.provider_manager.get_enabled_providers()
+        )
 
     def _create_client(self, provider: ProviderConfig) -> LLMClient:
-        """Create an LLM client for a provider."""
-        if provider.type == ProviderType.ANTHROPIC:
-            return AnthropicClient(
-                model=provider.default_model,
-                api_key=provider.api_key,
-            )
-        else:  # openai or openai-compatible
-            return OpenAIClient(
-                model=provider.default_model,
-                api_key=provider.api_key,
-                base_url=provider.base_url,
-            )
+        """Get the shared LLM client for a provider."""
+        return get_client(provider)
+
+    async def prewarm(self) -> None:
+        """Open connections to every enabled provider ahead of the first call.
+
+        Failures are ignored here; they surface on the real request instead.
+        """
+        providers = self.provider_manager.get_enabled_providers()
+        await asyncio.gather(
+            *(self._create_client(p).prewarm() for p in providers),
+            return_exceptions=True,
+        )
+
+    async def close(self) -> None:
+        """Close the shared provider clients and their connection pools.
+
+        Clients are recreated on next use, so this is safe to call at shutdown
+        even if other MultiClient instances exist.
+        """
+        await close_clients()
 
     async def _try_provider(
         self,
         provider: ProviderConfig,
-        messages: list[LLMMessage],
+        messages: list[MessageLike],
         temperature: float,
         max_tokens: Optional[int],
     ) -> LLMResponse:
         """Try to get completion from a single provider."""
         client = self._create_client(provider)
-        return await client.complete(messages, temperature, max_tokens)
+        limiter = self.provider_manager.get_limiter(provider)
+        reservation = await limiter.acquire(estimate_tokens(messages, max_tokens))
+        start = time.perf_counter()
+        try:
+            response = await client.complete(messages, temperature, max_tokens)
+        except Exception as e:
+            limiter.on_error(e)
+            raise
+        finally:
+            await limiter.release()
+        limiter.on_success(time.perf_counter() - start)
+        if total_tokens := response.usage.get("total_tokens"):
+            limiter.settle(reservation, total_tokens)
+        return response
+
+    @staticmethod
+    def _retry_delay(
+        provider: ProviderConfig, error: Exception, attempt: int, settings
+    ) -> Optional[float]:
+        """Seconds to wait before retrying a provider, or None to move on."""
+        if not is_retryable(error):
+            return None  # Auth and request errors won't fix themselves
+        if attempt >= settings.max_retries - 1:
+            return None
+
+        # Prefer the server's retry-after over exponential backoff
+        wait_time = retry_after(error)
+        if wait_time is None:
+            # Jitter so concurrent callers don't retry in lockstep
+            base = min(settings.retry_delay * (2 ** attempt), MAX_BACKOFF)
+            return random.uniform(base * 0.5, base * 1.5)
+        if wait_time > MAX_BACKOFF:
+            # Don't park the caller (and its meeting slot) for longer than
+            # any backoff; try the next provider
+            logger.info("%s asked to wait %.0fs; moving on", provider.name, wait_time)
+            return None
+        return wait_time
+
+    async def _hedged(
+        self,
+        primary: ProviderConfig,
+        backup: ProviderConfig,
+        messages: list[MessageLike],
+        temperature: float,
+        max_tokens: Optional[int],
+        delay: float,
+    ) -> tuple[ProviderConfig, LLMResponse]:
+        """Start the backup provider if the primary is slow; first success wins."""
+        tasks = {
+            asyncio.create_task(self._try_provider(primary, messages, temperature, max_tokens)): primary
+        }
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            logger.info("Hedging %s with %s", primary.name, backup.name)
+            task = asyncio.create_task(self._try_provider(backup, messages, temperature, max_tokens))
+            tasks[task] = backup
+
+        errors: dict[str, str] = {}
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return tasks[task], task.result()
+                    errors[tasks[task].name] = str(task.exception())
+        finally:
+            for task in pending:
+                task.cancel()
+        raise MultiClientError(errors)
 
     async def complete(
         self,
-        messages: list[LLMMessage],
+        messages: list[MessageLike],
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
         specific_provider: Optional[str] = None,
@@ -84,26 +202,57 @@ class MultiClient:
         if not providers:
             raise MultiClientError({"all": "No providers available"})
 
+        # Convert once; every provider and retry reuses the same dicts
+        messages = to_message_dicts(messages)
+
         errors: dict[str, str] = {}
+        hedge = settings.auto_switch and settings.hedge_delay_ms > 0 and len(providers) > 1
+
+        for index, provider in enumerate(providers):
+            cache_key = None
+            if settings.cache_enabled:
+                cache_key = self.cache.cache_key(
+                    provider.id, provider.default_model, messages, temperature, max_tokens
+                )
+                if cache_key and (cached := await self.cache.get(cache_key)):
+                    return cached
+
+            if hedge and index == 0:
+                try:
+                    winner, response = await self._hedged(
+                        provider, providers[1], messages, temperature, max_tokens,
+                        settings.hedge_delay_ms / 1000,
+                    )
+                    logger.info("Success with %s", winner.name)
+                    if cache_key and winner is provider:
+                        await self.cache.set(cache_key, response)
+                    return response
+                except MultiClientError as e:
+                    # Both failed once; fall back to the regular retry loop
+                    errors.update(e.errors)
 
-        for provider in providers:
             for attempt in range(settings.max_retries):
                 try:
-                    print(f"  🔄 Trying {provider.name} (attempt {attempt + 1}/{settings.max_retries})...")
+                    logger.info(
+                        "Trying %s (attempt %d/%d)", provider.name, attempt + 1, settings.max_retries
+                    )
                     response = await self._try_provider(
                         provider, messages, temperature, max_tokens
                     )
-                    print(f"  ✅ Success with {provider.name}")
+                    logger.info("Success with %s", provider.name)
+                    if cache_key:
+                        await self.cache.set(cache_key, response)
                     return response
                 except Exception as e:
                     error_msg = str(e)
                     errors[provider.name] = error_msg
-                    print(f"  ❌ {provider.name} failed: {error_msg[:100]}")
+                    logger.warning("%s failed: %.100s", provider.name, error_msg)
 
-                    if attempt < settings.max_retries - 1:
-                        wait_time = settings.retry_delay * (2 ** attempt)  # Exponential backoff
-                        print(f"  ⏳ Retrying in {wait_time:.1f}s...")
-                        await asyncio.sleep(wait_time)
+                    wait_time = self._retry_delay(provider, e, attempt, settings)
+                    if wait_time is None:
+                        break
+                    logger.info("Retrying %s in %.1fs", provider.name, wait_time)
+                    await asyncio.sleep(wait_time)
 
             if not settings.auto_switch:
                 break
@@ -113,7 +262,7 @@ class MultiClient:
 
     async def stream(
         self,
-        messages: list[LLMMessage],
+        messages: list[MessageLike],
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
         specific_provider: Optional[str] = None,
@@ -121,8 +270,11 @@ class MultiClient:
         """
         Stream response, trying providers in order until one succeeds.
 
-        Note: If the first provider fails mid-stream, we cannot switch.
-        This method tries to start streaming with each provider.
+        Each attempt holds a slot in the provider's rate limiter, as
+        complete() does. Failures before the first chunk are retried and then
+        switch provider; once chunks have been yielded, a failure raises
+        MultiClientError rather than splicing a second provider's answer onto
+        the first one's.
         """
         settings = self.provider_manager.get_settings()
 
@@ -135,18 +287,46 @@ class MultiClient:
         if not providers:
             raise MultiClientError({"all": "No providers available"})
 
+        # Convert once; every provider and retry reuses the same dicts
+        messages = to_message_dicts(messages)
+
         errors: dict[str, str] = {}
+        estimate = estimate_tokens(messages, max_tokens)
 
         for provider in providers:
-            try:
-                client = self._create_client(provider)
-                async for chunk in client.stream(messages, temperature, max_tokens):
-                    yield chunk
-                return
-            except Exception as e:
-                errors[provider.name] = str(e)
-                if not settings.auto_switch:
+            limiter = self.provider_manager.get_limiter(provider)
+
+            for attempt in range(settings.max_retries):
+                started = False
+                await limiter.acquire(estimate)
+                start = time.perf_counter()
+                try:
+                    client = self._create_client(provider)
+                    async for chunk in buffered(client.stream(messages, temperature, max_tokens)):
+                        if not started:
+                            started = True
+                            # Time to first chunk: the whole stream's length
+                            # says more about the answer than the provider
+                            limiter.on_success(time.perf_counter() - start)
+                        yield chunk
+                    return
+                except Exception as e:
+                    limiter.on_error(e)
+                    errors[provider.name] = str(e)
+                    logger.warning("%s failed: %.100s", provider.name, str(e))
+                    if started:
+                        raise MultiClientError(errors) from e
+                    wait_time = self._retry_delay(provider, e, attempt, settings)
+                finally:
+                    await limiter.release()
+
+                if wait_time is None:
                     break
+                logger.info("Retrying %s in %.1fs", provider.name, wait_time)
+                await asyncio.sleep(wait_time)
+
+            if not settings.auto_switch:
+                break
 
         raise MultiClientError(errors)
 
@@ -156,7 +336,10 @@ class MultiClient:
 
     async def test_provider(self, provider_id: str) -> tuple[bool, str]:
         """
-        Test a specific provider.
+        Test a specific provider with a one-token probe.
+
+        Results are cached for HEALTH_TTL seconds, as long as the provider's
+        type, key, base URL and model are unchanged.
 
         Returns:
             (success, message)
@@ -168,26 +351,37 @@ class MultiClient:
         if not provider.enabled:
             return False, f"Provider {provider_id} is disabled"
 
+        config = (provider.type, provider.api_key, provider.base_url, provider.default_model)
+        cached = self._health.get(provider_id)
+        if cached and cached[1] == config and time.monotonic() - cached[0] < HEALTH_TTL:
+            return cached[2], cached[3]
+
         try:
-            messages = [
-                LLMMessage("system", "You are a helpful assistant."),
-                LLMMessage("user", "Say 'Test successful' and nothing else."),
-            ]
-            response = await self._try_provider(provider, messages, 0.7, None)
-            if "Test successful" in response.content:
-                return True, f"Provider {provider.name} is working"
-            else:
-                return True, f"Provider {provider.name} responded (unexpected content)"
+            await asyncio.wait_for(
+                self._try_provider(provider, [LLMMessage("user", "ping")], 0.0, 1),
+                timeout=PROBE_TIMEOUT,
+            )
+            success, message = True, f"Provider {provider.name} is working"
         except Exception as e:
-            return False, f"Provider {provider.name} failed: {str(e)[:100]}"
+            success = False
+            message = f"Provider {provider.name} failed ({classify_error(e)}): {str(e)[:100]}"
+
+        self._health[provider_id] = (time.monotonic(), config, success, message)
+        return success, message
 
     async def test_all_providers(self) -> dict[str, tuple[bool, str]]:
         """Test all enabled providers."""
-        results = {}
-        providers = self.provider_manager.list_providers()
-
-        for provider in providers:
-            success, message = await self.test_provider(provider.id)
-            results[provider.id] = (success, message)
+        ids = [p.id for p in self.provider_manager.list_providers()]
+        outcomes = await asyncio.gather(
+            *(asyncio.wait_for(self.test_provider(i), timeout=PROBE_TIMEOUT) for i in ids),
+            return_exceptions=True,
+        )
 
+        results = {}
+        for provider_id, outcome in zip(ids, outcomes):
+            if isinstance(outcome, asyncio.TimeoutError):
+                outcome = (False, f"Provider {provider_id} timed out after {PROBE_TIMEOUT:.0f}s")
+            elif isinstance(outcome, BaseException):
+                outcome = (False, f"Provider {provider_id} failed: {str(outcome)[:100]}")
+            results[provider_id] = outcome
         return results
@@ -1,11 +1,11 @@
 """Manager for LLM provider configurations."""
 
-import json
 import os
 from pathlib import Path
 from typing import Optional
 
 from .provider_types import ProviderConfig, ProvidersConfig
+from .rate_limit import AdaptiveLimiter, LimiterRegistry
 
 
 class ProviderManager:
@@ -16,6 +16,9 @@ class ProviderManager:
     def __init__(self, config_path: Optional[Path] = None):
         self.config_path = config_path or self.DEFAULT_CONFIG_PATH
         self._config: Optional[ProvidersConfig] = None
+        self._mtime: Optional[int] = None
+        self._enabled_cache: Optional[tuple[ProviderConfig, ...]] = None
+        self._limiters = LimiterRegistry()
         self._ensure_config_dir()
 
     def _ensure_config_dir(self) -> None:
@@ -23,20 +26,24 @@ class ProviderManager:
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
 
     def load_config(self) -> ProvidersConfig:
-        """Load configuration from file."""
-        if self._config is not None:
+        """Load configuration from file, reloading it if the file changed."""
+        try:
+            mtime = self.config_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+
+        if self._config is not None and (mtime is None or mtime == self._mtime):
             return self._config
 
-        if not self.config_path.exists():
+        if mtime is None:
             # Create default config
             self._config = self._create_default_config()
             self.save_config()
             return self._config
 
-        with open(self.config_path, "r") as f:
-            data = json.load(f)
-
-        self._config = ProvidersConfig.model_validate(data)
+        self._config = ProvidersConfig.model_validate_json(self.config_path.read_bytes())
+        self._mtime = mtime
+        self._enabled_cache = None
         return self._config
 
     def save_config(self) -> None:
@@ -44,11 +51,16 @@ class ProviderManager:
         if self._config is None:
             return
 
-        with open(self.config_path, "w") as f:
-            json.dump(self._config.model_dump(), f, indent=2)
+        # Write to a sibling file and rename so a crash never leaves a partial config
+        tmp_path = self.config_path.with_suffix(".tmp")
+        tmp_path.write_text(self._config.model_dump_json(indent=2))
 
         # Set restrictive permissions
-        os.chmod(self.config_path, 0o600)
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, self.config_path)
+
+        self._mtime = self.config_path.stat().st_mtime_ns
+        self._enabled_cache = None
 
     def _create_default_config(self) -> ProvidersConfig:
         """Create default configuration with Kimi."""
@@ -118,9 +130,14 @@ class ProviderManager:
         return config.providers
 
     def get_enabled_providers(self) -> list[ProviderConfig]:
-        """Get enabled providers sorted by priority."""
+        """Get enabled providers sorted by priority.
+
+        The sorted order is memoized; callers get their own copy of the list.
+        """
         config = self.load_config()
-        return config.get_enabled_providers()
+        if self._enabled_cache is None:
+            self._enabled_cache = tuple(config.get_enabled_providers())
+        return list(self._enabled_cache)
 
     def get_provider(self, provider_id: str) -> Optional[ProviderConfig]:
         """Get a provider by ID."""
@@ -131,3 +148,7 @@ class ProviderManager:
         """Get multi-provider settings."""
         config = self.load_config()
         return config.settings
+
+    def get_limiter(self, provider: ProviderConfig) -> AdaptiveLimiter:
+        """Get the adaptive rate limiter for a provider."""
+        return self._limiters.get(provider)
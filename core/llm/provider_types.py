@@ -1,6 +1,7 @@
 """Types and models for LLM providers."""
 
 from enum import Enum
+from operator import attrgetter
 from typing import Optional
 
 from pydantic import BaseModel, Field
@@ -14,6 +15,35 @@ class ProviderType(str, Enum):
     ANTHROPIC = "anthropic"
 
 
+# Default rate limits and AIMD tuning per provider type
+DEFAULT_LIMITS: dict[ProviderType, dict[str, int | float]] = {
+    ProviderType.OPENAI: {
+        "rpm": 500,
+        "tpm": 30000,
+        "max_concurrency": 16,
+        "latency_target_ms": 8000.0,
+        "aimd_alpha": 1.0,
+        "aimd_beta": 0.5,
+    },
+    ProviderType.ANTHROPIC: {
+        "rpm": 50,
+        "tpm": 40000,
+        "max_concurrency": 8,
+        "latency_target_ms": 10000.0,
+        "aimd_alpha": 1.0,
+        "aimd_beta": 0.5,
+    },
+    ProviderType.OPENAI_COMPATIBLE: {
+        "rpm": 60,
+        "tpm": 100000,
+        "max_concurrency": 4,
+        "latency_target_ms": 15000.0,
+        "aimd_alpha": 0.5,
+        "aimd_beta": 0.5,
+    },
+}
+
+
 class ProviderConfig(BaseModel):
     """Configuration for a single LLM provider."""
 
@@ -26,6 +56,25 @@ class ProviderConfig(BaseModel):
     default_model: str = Field(..., description="Default model to use")
     priority: int = Field(1, description="Priority (lower = higher priority)")
     enabled: bool = Field(True, description="Whether this provider is enabled")
+    rpm: Optional[int] = Field(None, description="Requests per minute limit")
+    tpm: Optional[int] = Field(None, description="Tokens per minute limit")
+    max_concurrency: Optional[int] = Field(None, description="Max in-flight requests")
+    latency_target_ms: Optional[float] = Field(None, description="AIMD latency target")
+    aimd_alpha: Optional[float] = Field(None, description="AIMD additive increase")
+    aimd_beta: Optional[float] = Field(None, description="AIMD multiplicative decrease")
+    prompt_cache_enabled: bool = Field(True, description="Mark system prompts cacheable (Anthropic)")
+
+    def limits(self) -> dict[str, int | float]:
+        """Get the rate limits and AIMD tuning, with defaults for unset ones.
+
+        Defaults are resolved here rather than stored on the model, so saved
+        configs keep only what was set and follow later changes to
+        DEFAULT_LIMITS.
+        """
+        return {
+            name: default if (value := getattr(self, name)) is None else value
+            for name, default in DEFAULT_LIMITS[self.type].items()
+        }
 
 
 class MultiProviderSettings(BaseModel):
@@ -35,6 +84,8 @@ class MultiProviderSettings(BaseModel):
     max_retries: int = Field(3, description="Max retries per provider")
     retry_delay: float = Field(1.0, description="Delay between retries in seconds")
     fallback_to_mock: bool = Field(True, description="Fallback to mock mode if all fail")
+    cache_enabled: bool = Field(False, description="Cache temperature=0 responses")
+    hedge_delay_ms: int = Field(0, description="Race the next provider after this delay (0 = off)")
 
 
 class ProvidersConfig(BaseModel):
@@ -47,7 +98,7 @@ class ProvidersConfig(BaseModel):
         """Get all enabled providers sorted by priority."""
         return sorted(
             [p for p in self.providers if p.enabled],
-            key=lambda p: p.priority
+            key=attrgetter("priority")
         )
 
     def get_provider(self, provider_id: str) -> Optional[ProviderConfig]:
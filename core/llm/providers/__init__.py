@@ -1 +1,71 @@
+"""LLM provider clients, shared per configuration across the process."""
 
+from typing import Callable
+
+from core.llm.base import LLMClient
+from core.llm.provider_types import ProviderConfig, ProviderType
+
+from .http import create_http_client
+
+
+def _build_anthropic(provider: ProviderConfig) -> LLMClient:
+    from anthropic import DefaultAsyncHttpxClient
+
+    from .anthropic_client import AnthropicClient
+
+    return AnthropicClient(
+        model=provider.default_model,
+        api_key=provider.api_key,
+        http_client=create_http_client(DefaultAsyncHttpxClient),
+        prompt_cache=provider.prompt_cache_enabled,
+    )
+
+
+def _build_openai(provider: ProviderConfig) -> LLMClient:
+    from openai import DefaultAsyncHttpxClient
+
+    from .openai_client import OpenAIClient
+
+    return OpenAIClient(
+        model=provider.default_model,
+        api_key=provider.api_key,
+        base_url=provider.base_url,
+        http_client=create_http_client(DefaultAsyncHttpxClient),
+    )
+
+
+# Client builder per provider type; SDKs are imported on first use
+FACTORY: dict[ProviderType, Callable[[ProviderConfig], LLMClient]] = {
+    ProviderType.ANTHROPIC: _build_anthropic,
+    ProviderType.OPENAI: _build_openai,
+    ProviderType.OPENAI_COMPATIBLE: _build_openai,
+}
+
+# One client (and connection pool) per provider configuration
+_REGISTRY: dict[tuple, LLMClient] = {}
+
+
+def get_client(provider: ProviderConfig) -> LLMClient:
+    """Get the shared client for a provider, creating it on first use."""
+    key = (
+        provider.type,
+        provider.api_key,
+        provider.base_url,
+        provider.default_model,
+        provider.prompt_cache_enabled,
+    )
+    client = _REGISTRY.get(key)
+    if client is not None:
+        return client
+
+    client = FACTORY.get(provider.type, _build_openai)(provider)
+    _REGISTRY[key] = client
+    return client
+
+
+async def close_clients() -> None:
+    """Close every shared client and release its connections."""
+    clients = list(_REGISTRY.values())
+    _REGISTRY.clear()
+    for client in clients:
+        await client.close()
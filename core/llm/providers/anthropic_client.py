@@ -4,35 +4,68 @@ from typing import Any, AsyncIterator
 
 from anthropic import AsyncAnthropic
 
-from core.llm.base import LLMClient, LLMMessage, LLMResponse
+from core.llm.base import LLMClient, LLMResponse, MessageLike, to_message_dicts
+
+# The API accepts at most four cache breakpoints per request
+MAX_CACHE_BREAKPOINTS = 4
 
 
 class AnthropicClient(LLMClient):
     """Anthropic API client."""
 
-    def __init__(self, model: str = "claude-3-5-sonnet-20241022", api_key: str | None = None):
+    __slots__ = ("client", "prompt_cache")
+
+    def __init__(
+        self,
+        model: str = "claude-3-5-sonnet-20241022",
+        api_key: str | None = None,
+        http_client: Any | None = None,
+        prompt_cache: bool = True,
+    ):
         super().__init__(model, api_key)
-        self.client = AsyncAnthropic(api_key=api_key)
+        self.client = AsyncAnthropic(api_key=api_key, http_client=http_client)
+        self.prompt_cache = prompt_cache
+
+    @staticmethod
+    def _split(messages: list[MessageLike]) -> tuple[list[str], list[dict[str, str]]]:
+        """Separate system contents from the conversation messages."""
+        system_parts = []
+        other_messages = []
+        for m in to_message_dicts(messages):
+            if m["role"] == "system":
+                system_parts.append(m["content"])
+            else:
+                other_messages.append(m)
+        return system_parts, other_messages
+
+    def _system_param(self, system_parts: list[str]) -> str | list[dict[str, Any]] | None:
+        """Build the system argument, marking static blocks for prompt caching.
+
+        System messages come first and change least often (agent prompt,
+        then context), so each one is a cache breakpoint.
+        """
+        if not system_parts:
+            return None
+        if not self.prompt_cache:
+            return "\n\n".join(system_parts)
+
+        blocks: list[dict[str, Any]] = [{"type": "text", "text": text} for text in system_parts]
+        for block in blocks[:MAX_CACHE_BREAKPOINTS]:
+            block["cache_control"] = {"type": "ephemeral"}
+        return blocks
 
     async def complete(
         self,
-        messages: list[LLMMessage],
+        messages: list[MessageLike],
         temperature: float = 0.7,
         max_tokens: int | None = None,
     ) -> LLMResponse:
         """Send messages and get a complete response."""
-        # Separate system message from other messages
-        system_message = ""
-        other_messages = []
-        for m in messages:
-            if m.role == "system":
-                system_message = m.content
-            else:
-                other_messages.append(m.to_dict())
+        system_parts, other_messages = self._split(messages)
 
         response = await self.client.messages.create(
             model=self.model,
-            system=system_message if system_message else None,
+            system=self._system_param(system_parts),
             messages=other_messages,
             temperature=temperature,
             max_tokens=max_tokens or 4096,
@@ -47,22 +80,16 @@ class AnthropicClient(LLMClient):
 
     async def stream(
         self,
-        messages: list[LLMMessage],
+        messages: list[MessageLike],
         temperature: float = 0.7,
         max_tokens: int | None = None,
     ) -> AsyncIterator[str]:
         """Stream response chunks."""
-        system_message = ""
-        other_messages = []
-        for m in messages:
-            if m.role == "system":
-                system_message = m.content
-            else:
-                other_messages.append(m.to_dict())
+        system_parts, other_messages = self._split(messages)
 
         stream = await self.client.messages.create(
             model=self.model,
-            system=system_message if system_message else None,
+            system=self._system_param(system_parts),
             messages=other_messages,
             temperature=temperature,
             max_tokens=max_tokens or 4096,
@@ -72,3 +99,11 @@ class AnthropicClient(LLMClient):
             if event.type == "content_block_delta":
                 if event.delta.text:
                     yield event.delta.text
+
+    async def prewarm(self) -> None:
+        """Open a connection to the API with a cheap model listing request."""
+        await self.client.with_options(max_retries=0, timeout=5.0).models.list()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self.client.close()
@@ -0,0 +1,32 @@
+"""Shared HTTP transport settings for provider SDK clients."""
+
+import importlib.util
+from typing import Any
+
+import httpx
+
+# Connection pool sizing for one provider endpoint
+POOL_LIMITS = {
+    "max_connections": 50,
+    "max_keepalive_connections": 20,
+    "keepalive_expiry": 30,
+}
+
+# Long reads for slow completions, short everything else
+TIMEOUTS = {"connect": 10.0, "read": 120.0, "write": 30.0, "pool": 30.0}
+
+# HTTP/2 multiplexes concurrent requests over one connection but needs h2
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def create_http_client(default_client: type) -> Any:
+    """Create a pooled async HTTP client for an SDK to reuse across calls.
+
+    ``default_client`` is the SDK's ``DefaultAsyncHttpxClient``, which keeps
+    the SDK's timeouts and socket options.
+    """
+    return default_client(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(**POOL_LIMITS),
+        timeout=httpx.Timeout(**TIMEOUTS),
+    )
@@ -4,26 +4,34 @@ from typing import Any, AsyncIterator
 
 from openai import AsyncOpenAI
 
-from core.llm.base import LLMClient, LLMMessage, LLMResponse
+from core.llm.base import LLMClient, LLMResponse, MessageLike, to_message_dicts
 
 
 class OpenAIClient(LLMClient):
     """OpenAI API client."""
 
-    def __init__(self, model: str = "gpt-4o", api_key: str | None = None, base_url: str | None = None):
+    __slots__ = ("client",)
+
+    def __init__(
+        self,
+        model: str = "gpt-4o",
+        api_key: str | None = None,
+        base_url: str | None = None,
+        http_client: Any | None = None,
+    ):
         super().__init__(model, api_key)
-        self.client = AsyncOpenAI(api_key=api_key, base_url=base_url)
+        self.client = AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
 
     async def complete(
         self,
-        messages: list[LLMMessage],
+        messages: list[MessageLike],
         temperature: float = 0.7,
         max_tokens: int | None = None,
     ) -> LLMResponse:
         """Send messages and get a complete response."""
         response = await self.client.chat.completions.create(
             model=self.model,
-            messages=[m.to_dict() for m in messages],
+            messages=to_message_dicts(messages),
             temperature=temperature,
             max_tokens=max_tokens,
         )
@@ -37,19 +45,28 @@ class OpenAIClient(LLMClient):
 
     async def stream(
         self,
-        messages: list[LLMMessage],
+        messages: list[MessageLike],
         temperature: float = 0.7,
         max_tokens: int | None = None,
     ) -> AsyncIterator[str]:
         """Stream response chunks."""
         stream = await self.client.chat.completions.create(
             model=self.model,
-            messages=[m.to_dict() for m in messages],
+            messages=to_message_dicts(messages),
             temperature=temperature,
             max_tokens=max_tokens,
             stream=True,
         )
         async for chunk in stream:
-            content = chunk.choices[0].delta.content
-            if content:
+            # Usage/keep-alive chunks arrive with no choices
+            choices = chunk.choices
+            if choices and (content := choices[0].delta.content):
                 yield content
+
+    async def prewarm(self) -> None:
+        """Open a connection to the API with a cheap model listing request."""
+        await self.client.with_options(max_retries=0, timeout=5.0).models.list()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self.client.close()
@@ -0,0 +1,247 @@
+"""Adaptive per-provider rate limiting (AIMD concurrency + RPM window)."""
+
+import asyncio
+import time
+from collections import deque
+from typing import Optional
+
+from .base import MessageLike, to_message_dicts
+from .provider_types import ProviderConfig
+
+# Sliding window length for RPM/TPM accounting
+WINDOW_SECONDS = 60.0
+
+# Fraction of the TPM budget to use before holding requests back
+TPM_HEADROOM = 0.9
+
+# HTTP statuses worth retrying against the same provider
+RETRYABLE_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+def estimate_tokens(messages: list[MessageLike], max_tokens: Optional[int] = None) -> int:
+    """Roughly estimate the tokens a request will use (~4 chars per token).
+
+    Only string lengths are read, so no tokenizer runs on the request path;
+    the estimate is corrected from the provider's reported usage anyway.
+    """
+    chars = sum(len(m["content"]) for m in to_message_dicts(messages))
+    return chars // 4 + 4 * len(messages) + (max_tokens or 0)
+
+
+def error_status(exc: BaseException) -> Optional[int]:
+    """Get the HTTP status code carried by an SDK/httpx error, if any."""
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        response = getattr(exc, "response", None)
+        status = getattr(response, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_rate_limited(exc: BaseException) -> bool:
+    """Check whether an error is a provider rate limit (HTTP 429)."""
+    return error_status(exc) == 429 or type(exc).__name__ == "RateLimitError"
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Check whether retrying the same provider could succeed."""
+    status = error_status(exc)
+    if status is not None:
+        return status in RETRYABLE_STATUS
+    # No HTTP status: connection/timeout problems are transient, auth is not
+    return classify_error(exc) != "invalid_key"
+
+
+def classify_error(exc: BaseException) -> str:
+    """Map a provider error to a health status."""
+    status = error_status(exc)
+    name = type(exc).__name__
+    if status in (401, 403) or name in ("AuthenticationError", "PermissionDeniedError"):
+        return "invalid_key"
+    if is_rate_limited(exc):
+        return "rate_limited"
+    if (
+        isinstance(exc, (asyncio.TimeoutError, ConnectionError))
+        or name in ("APITimeoutError", "APIConnectionError")
+        or (status is not None and status >= 500)
+    ):
+        return "unavailable"
+    return "error"
+
+
+def retry_after(exc: BaseException) -> Optional[float]:
+    """Get the server-requested wait in seconds from an error's headers."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+
+    for name, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return max(float(value) * scale, 0.0)
+        except ValueError:
+            continue  # HTTP-date form; fall through to the rate limit headers
+
+    if headers.get("x-ratelimit-remaining-requests") == "0":
+        reset = headers.get("x-ratelimit-reset-requests", "")
+        try:
+            return float(reset.rstrip("s"))
+        except ValueError:
+            return None
+    return None
+
+
+class AdaptiveLimiter:
+    """Concurrency gate whose limit follows AIMD on latency and 429s.
+
+    The limit grows by ``alpha`` after each success faster than the latency
+    target and is multiplied by ``beta`` on rate limits and server errors.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        rpm: int,
+        latency_target_ms: float,
+        alpha: float,
+        beta: float,
+        tpm: Optional[int] = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.rpm = rpm
+        self.tpm = tpm
+        self.latency_target = latency_target_ms / 1000
+        self.alpha = alpha
+        self.beta = beta
+        self.limit = float(max_concurrency)
+        self.in_flight = 0
+        self._cond: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._requests: deque[float] = deque()
+        # [timestamp, tokens] entries; tokens are corrected once usage is known
+        self._tokens: deque[list] = deque()
+        self._blocked_until = 0.0
+
+    @classmethod
+    def from_config(cls, provider: ProviderConfig) -> "AdaptiveLimiter":
+        """Create a limiter from a provider's limits (or their defaults)."""
+        limits = provider.limits()
+        return cls(
+            max_concurrency=limits["max_concurrency"],
+            rpm=limits["rpm"],
+            latency_target_ms=limits["latency_target_ms"],
+            alpha=limits["aimd_alpha"],
+            beta=limits["aimd_beta"],
+            tpm=limits["tpm"],
+        )
+
+    def _window_delay(self, now: float) -> float:
+        """Seconds until the RPM window (or a server backoff) admits a request."""
+        while self._requests and now - self._requests[0] >= WINDOW_SECONDS:
+            self._requests.popleft()
+        delay = self._blocked_until - now
+        if len(self._requests) >= self.rpm:
+            delay = max(delay, self._requests[0] + WINDOW_SECONDS - now)
+        return delay
+
+    def _token_delay(self, now: float, tokens: int) -> float:
+        """Seconds until the TPM window has room for ``tokens`` more."""
+        while self._tokens and now - self._tokens[0][0] >= WINDOW_SECONDS:
+            self._tokens.popleft()
+        if not self.tpm or not self._tokens:
+            return 0.0
+
+        budget = self.tpm * TPM_HEADROOM
+        used = sum(entry[1] for entry in self._tokens)
+        if used + tokens <= budget:
+            return 0.0
+        # Wait for enough of the oldest entries to age out
+        for ts, spent in self._tokens:
+            used -= spent
+            if used + tokens <= budget:
+                return ts + WINDOW_SECONDS - now
+        return self._tokens[-1][0] + WINDOW_SECONDS - now
+
+    def _condition(self) -> asyncio.Condition:
+        """Get the slot condition, rebinding it if the event loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._cond = asyncio.Condition()
+            self.in_flight = 0
+        return self._cond
+
+    async def acquire(self, tokens: int = 0) -> list:
+        """Wait for a concurrency slot and room in the RPM and TPM windows.
+
+        Returns the token reservation to pass to ``settle`` once the
+        request's real usage is known.
+        """
+        cond = self._condition()
+        async with cond:
+            await cond.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+        try:
+            while True:
+                now = time.monotonic()
+                delay = max(self._window_delay(now), self._token_delay(now, tokens))
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+        except BaseException:
+            await self.release()
+            raise
+
+        now = time.monotonic()
+        self._requests.append(now)
+        reservation = [now, tokens]
+        self._tokens.append(reservation)
+        return reservation
+
+    @staticmethod
+    def settle(reservation: list, tokens: int) -> None:
+        """Replace a request's estimated tokens with its actual usage."""
+        reservation[1] = tokens
+
+    async def release(self) -> None:
+        """Return a concurrency slot."""
+        cond = self._condition()
+        async with cond:
+            self.in_flight -= 1
+            cond.notify_all()
+
+    def on_success(self, latency: float) -> None:
+        """Additively raise the limit when the provider is keeping up."""
+        if latency < self.latency_target:
+            self.limit = min(self.limit + self.alpha, self.max_concurrency)
+
+    def on_error(self, exc: BaseException) -> None:
+        """Multiplicatively shrink the limit on rate limits and server errors."""
+        status = error_status(exc)
+        rate_limited = is_rate_limited(exc)
+        if not rate_limited and (status is None or status < 500):
+            return
+
+        self.limit = max(self.limit * self.beta, 1.0)
+        if rate_limited:
+            wait = retry_after(exc)
+            if wait:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + wait)
+
+
+class LimiterRegistry:
+    """One limiter per provider, rebuilt when its limits change."""
+
+    def __init__(self):
+        self._limiters: dict[str, tuple[tuple, AdaptiveLimiter]] = {}
+
+    def get(self, provider: ProviderConfig) -> AdaptiveLimiter:
+        """Get the limiter for a provider."""
+        key = tuple(provider.limits().values())
+        entry = self._limiters.get(provider.id)
+        if entry is None or entry[0] != key:
+            entry = (key, AdaptiveLimiter.from_config(provider))
+            self._limiters[provider.id] = entry
+        return entry[1]
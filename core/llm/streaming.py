@@ -0,0 +1,37 @@
+"""Helpers for streaming LLM output."""
+
+import asyncio
+from typing import AsyncIterator, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+async def buffered(source: AsyncIterator[T], size: int = 8) -> AsyncIterator[T]:
+    """Prefetch up to ``size`` items from ``source`` while the caller consumes.
+
+    Errors raised by ``source`` are re-raised to the caller in order.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+
+    async def produce() -> None:
+        try:
+            async for item in source:
+                await queue.put(item)
+        except Exception as e:
+            await queue.put(e)
+        else:
+            await queue.put(_DONE)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        producer.cancel()
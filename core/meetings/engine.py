@@ -1,8 +1,13 @@
 """Meeting engine for orchestrating hybrid async/sync meetings."""
 
-import uuid
+import asyncio
+import os
+import secrets
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Optional
+from datetime import datetime
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from core.artifacts.models import (
     ActionItem,
@@ -13,14 +18,21 @@ from core.artifacts.models import (
     MeetingPhase as ModelMeetingPhase,
     MeetingType as ModelMeetingType,
 )
+from core.agents.base import run_assignments
 from core.artifacts.store import ArtifactStore
+from core.llm.cache import CacheBackend
 from core.meetings.phases import AsyncPrepPhase, SyncDecisionPhase
-from core.meetings.types import MeetingPhase, MeetingStatus, MeetingType
+from core.meetings.types import DiscussionEntry, MeetingPhase, MeetingStatus, MeetingType
 
 if TYPE_CHECKING:
     from core.agents.base import BaseAgent
 
 
+def _default_llm_semaphore() -> asyncio.Semaphore:
+    """Cap concurrent LLM calls per meeting (MEETING_LLM_CONCURRENCY, default 8)."""
+    return asyncio.Semaphore(int(os.getenv("MEETING_LLM_CONCURRENCY", "8")))
+
+
 @dataclass
 class MeetingContext:
     """Context for a meeting."""
@@ -32,13 +44,27 @@ class MeetingContext:
     participants: list = field(default_factory=list)
     status: MeetingStatus = MeetingStatus.SCHEDULED
     current_phase: MeetingPhase = MeetingPhase.ASYNC_PREP
+    # Shared by all phases so concurrent turns don't burst past provider rate limits
+    llm_semaphore: asyncio.Semaphore = field(default_factory=_default_llm_semaphore)
+    # Optional cache of agent responses keyed by the exact request (see phases._think)
+    response_cache: Optional[CacheBackend] = None
+    # Called with (participant, chunk) as responses stream in; None = no streaming
+    on_token: Optional[Callable[[Any, str], None]] = None
+    # Called with ("DECISION" | "ACTION", draft) for each one parsed from the synthesis
+    on_output: Optional[Callable[[str, Any], None]] = None
 
 
 class MeetingEngine:
     """Engine for running meetings."""
 
-    def __init__(self, store: Optional[ArtifactStore] = None):
+    def __init__(
+        self,
+        store: Optional[ArtifactStore] = None,
+        response_cache: Optional[CacheBackend] = None,
+    ):
         self.store: ArtifactStore = store or ArtifactStore()
+        # Shared by every meeting, so replayed meetings reuse earlier answers
+        self.response_cache = response_cache
         self.active_meetings: dict[str, MeetingContext] = {}
 
     async def create_meeting(
@@ -47,9 +73,14 @@ class MeetingEngine:
         meeting_type: MeetingType,
         agenda: list[str],
         participants: list["BaseAgent"],
+        max_concurrency: Optional[int] = None,
     ) -> MeetingContext:
-        """Create a new meeting."""
-        meeting_id = str(uuid.uuid4())[:8]
+        """Create a new meeting.
+
+        ``max_concurrency`` caps this meeting's simultaneous LLM calls;
+        by default MEETING_LLM_CONCURRENCY applies.
+        """
+        meeting_id = secrets.token_hex(4)
 
         context = MeetingContext(
             meeting_id=meeting_id,
@@ -59,7 +90,10 @@ class MeetingEngine:
             participants=participants,
             status=MeetingStatus.SCHEDULED,
             current_phase=MeetingPhase.ASYNC_PREP,
+            response_cache=self.response_cache,
         )
+        if max_concurrency is not None:
+            context.llm_semaphore = asyncio.Semaphore(max_concurrency)
 
         self.active_meetings[meeting_id] = context
 
@@ -99,6 +133,9 @@ class MeetingEngine:
         context.status = MeetingStatus.COMPLETED
         context.current_phase = MeetingPhase.COMPLETED
 
+        # Meeting log, decisions and action items are written in one batch
+        artifacts: list[tuple[str, str, Any]] = []
+
         # Update meeting log
         log = self.store.load("meeting", meeting_id, MeetingLog)
         if log:
@@ -108,10 +145,11 @@ class MeetingEngine:
             log.discussion_summary = self._summarize_discussion(
                 decision_results["discussion_log"]
             )
-            log.completed_at = __import__("datetime").datetime.utcnow()
-            self.store.save("meeting", meeting_id, log)
+            log.completed_at = datetime.utcnow()
+            artifacts.append(("meeting", meeting_id, log))
 
-        # Save decisions
+        # Save decisions. Plain constructors on purpose: with pydantic-core,
+        # validating these small models is faster than model_construct.
         for decision_data in decision_results["decisions"]:
             decision = Decision(
                 id=decision_data["id"],
@@ -122,7 +160,7 @@ class MeetingEngine:
                 proposed_by="meeting",
                 meeting_id=meeting_id,
             )
-            self.store.save("decision", decision.id, decision)
+            artifacts.append(("decision", decision.id, decision))
 
         # Save action items
         for action_data in decision_results["action_items"]:
@@ -133,7 +171,9 @@ class MeetingEngine:
                 status=ActionItemStatus.TODO,
                 meeting_id=meeting_id,
             )
-            self.store.save("action_item", action.id, action)
+            artifacts.append(("action_item", action.id, action))
+
+        await self.store.asave_many(artifacts)
 
         return {
             "meeting_id": meeting_id,
@@ -143,16 +183,24 @@ class MeetingEngine:
             "status": "completed",
         }
 
-    def _summarize_discussion(self, discussion_log: list[dict]) -> str:
+    async def run_actions(
+        self,
+        assignments: list[tuple["BaseAgent", dict[str, Any]]],
+    ) -> list[dict[str, Any]]:
+        """Run agent tasks, overlapping those that are safe to run in parallel.
+
+        See core.agents.base.run_assignments; results are returned in the
+        order of ``assignments``.
+        """
+        return await run_assignments(assignments)
+
+    def _summarize_discussion(self, discussion_log: list[DiscussionEntry]) -> str:
         """Create a brief summary of the discussion."""
         if not discussion_log:
             return "No discussion recorded"
 
         # Simple summary: count contributions by role
-        role_counts = {}
-        for entry in discussion_log:
-            role = entry.get("agent_role", "Unknown")
-            role_counts[role] = role_counts.get(role, 0) + 1
+        role_counts = Counter(map(itemgetter("agent_role"), discussion_log))
 
         summary = "Discussion involved: " + ", ".join(
             f"{role} ({count} contributions)" for role, count in role_counts.items()
@@ -1,146 +1,313 @@
 """Meeting phases for hybrid async/sync coordination."""
 
-import uuid
+import asyncio
+import re
+import secrets
+from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from core.artifacts.models import AgentThought
-from .types import MeetingPhase
+from core.llm.cache import LLMCache
+
+from .types import ActionItemDraft, DecisionDraft, DiscussionEntry, MeetingPhase
 
 if TYPE_CHECKING:
     from .engine import MeetingContext
 
 
+# "DECISION: ..." / "ACTION: ..." lines in a synthesis, optionally numbered ("2. DECISION: ...")
+_OUTPUT_LINE_RE = re.compile(r"(?:\d+\.\s*)?(DECISION|ACTION):\s*(.*)")
+_ACTION_RE = re.compile(
+    r"(?P<description>.*?)"
+    r"(?:\s*\|\s*OWNER:\s*(?P<owner>.*?))?"
+    r"(?:\s*\|\s*DEADLINE:\s*(?P<deadline>.*))?$"
+)
+
+# Sampling temperature for every meeting turn (part of the response cache key)
+_TEMPERATURE = 0.7
+
+_PREP_SYSTEM_TEMPLATE = """You are preparing for a meeting: "{title}"
+
+Meeting type: {meeting_type}
+
+Agenda items:
+{agenda}
+
+Please prepare:
+1. KEY_POINTS: [What you want to communicate]
+2. RECOMMENDATIONS: [Your suggested actions]
+3. CONCERNS: [Risks or issues to raise]
+4. QUESTIONS: [What you need clarified]
+5. DATA: [Facts or analysis to share]
+
+Be concise but thorough. Your preparation will be shared with other participants.
+"""
+
+_PREP_USER_TEMPLATE = "Your role: {role}\n\nPrepare your input for this meeting."
+
+_DISCUSSION_SYSTEM_TEMPLATE = """You are in a meeting: "{title}"
+
+Agenda items:
+{agenda}
+
+Provide your contribution:
+1. REACTION: [Your response to what others said]
+2. POSITION: [Your stance on key issues]
+3. PROPOSAL: [Specific suggestions]
+4. CONCERNS: [Any remaining issues]
+
+Be constructive and aim for progress toward decisions.
+"""
+
+_DISCUSSION_TURN_TEMPLATE = """Your role: {role}
+Round: {round} of 2
+
+Discussion so far:
+{discussion_context}
+
+This round, focus on: {focus}
+"""
+
+_ROUND_FOCUS = (
+    "Share your perspective and react to others' inputs",
+    "Focus on converging toward decisions and addressing disagreements",
+)
+
+_SYNTHESIS_TEMPLATE = """As the meeting facilitator, synthesize the following discussion and produce clear outputs.
+
+Meeting: {title}
+Agenda: {agenda}
+
+Discussion:
+{discussion_context}
+
+Provide:
+1. SUMMARY: [Brief summary of key points discussed]
+2. DECISIONS: [Clear decisions made - format as "DECISION: [description]"]
+3. ACTION_ITEMS: [Specific tasks - format as "ACTION: [description] | OWNER: [role] | DEADLINE: [when]"]
+4. OPEN_QUESTIONS: [Issues not resolved]
+5. NEXT_STEPS: [What happens next]
+"""
+
+
+def _render_agenda(agenda: list[str]) -> str:
+    """Render agenda items as a bulleted block."""
+    return "\n".join(f"- {item}" for item in agenda)
+
+
+async def _think(
+    context: "MeetingContext",
+    participant,
+    prompt: str,
+    system: str | None = None,
+) -> str:
+    """Call participant.think while holding the meeting's LLM semaphore.
+
+    With a response cache on the context, an identical request (same model,
+    agent prompt and context, system block and prompt) is answered from the
+    cache. Discussion prompts embed the transcript so far, so a cached turn
+    only matches when the whole preceding discussion matches too.
+
+    With an on_token hook on the context, the response is streamed and each
+    chunk is passed to the hook as it arrives.
+    """
+    on_token = context.on_token
+    cache = context.response_cache
+    key = None
+    if cache is not None:
+        key = LLMCache.request_key(
+            "",
+            getattr(participant.llm_client, "model", None) or "",
+            participant.build_messages(prompt, system),
+            _TEMPERATURE,
+        )
+        if (cached := await cache.get(key)) is not None:
+            if on_token is not None:
+                on_token(participant, cached["content"])
+            return cached["content"]
+
+    async with context.llm_semaphore:
+        if on_token is None:
+            response = await participant.think(prompt, _TEMPERATURE, system)
+        else:
+            chunks = []
+            async for chunk in participant.think_stream(prompt, _TEMPERATURE, system):
+                chunks.append(chunk)
+                on_token(participant, chunk)
+            response = "".join(chunks)
+
+    if key is not None:
+        await cache.set(key, {"content": response})
+    return response
+
+
 class AsyncPrepPhase:
     """Async preparation phase where agents prepare their inputs independently."""
 
     def __init__(self, context: "MeetingContext"):
         self.context = context
         self.prep_results: dict[str, Any] = {}
+        # The agenda is fixed for the meeting, so the shared part is rendered once
+        self._system = _PREP_SYSTEM_TEMPLATE.format(
+            title=context.title,
+            meeting_type=context.meeting_type,
+            agenda=_render_agenda(context.agenda),
+        )
 
     async def run(self) -> dict[str, Any]:
         """Run async preparation for all participants."""
-        agenda = self.context.agenda
-        participants = self.context.participants
-
-        # Each participant prepares their input asynchronously
-        for participant in participants:
-            if hasattr(participant, "think"):
-                prompt = self._build_prep_prompt(participant, agenda)
-                try:
-                    response = await participant.think(prompt)
-                    self.prep_results[participant.id] = {
-                        "agent_id": participant.id,
-                        "agent_role": participant.role,
-                        "agent_name": participant.name,
-                        "preparation": response,
-                    }
-                    participant.add_thought(
-                        f"Prepared for meeting: {self.context.title}",
-                        meeting_id=self.context.meeting_id,
-                    )
-                except Exception as e:
-                    self.prep_results[participant.id] = {
-                        "agent_id": participant.id,
-                        "agent_role": participant.role,
-                        "agent_name": participant.name,
-                        "error": str(e),
-                    }
+        # Preparations are independent, so every participant prepares at once
+        results = await asyncio.gather(*(
+            self._prep_one(participant)
+            for participant in self.context.participants
+            if hasattr(participant, "think")
+        ))
+        self.prep_results = dict(results)
 
         return {
             "phase": MeetingPhase.ASYNC_PREP,
             "prep_results": self.prep_results,
         }
 
-    def _build_prep_prompt(self, participant, agenda: list[str]) -> str:
-        """Build preparation prompt for a participant."""
-        return f"""You are preparing for a meeting: "{self.context.title}"
+    async def _prep_one(self, participant) -> tuple[str, dict[str, Any]]:
+        """Prepare a single participant, capturing any error in the result."""
+        system, prompt = self._build_prep_prompt(participant)
+        try:
+            response = await _think(self.context, participant, prompt, system)
+        except Exception as e:
+            return participant.id, {
+                "agent_id": participant.id,
+                "agent_role": participant.role,
+                "agent_name": participant.name,
+                "error": str(e),
+            }
+
+        participant.add_thought(
+            f"Prepared for meeting: {self.context.title}",
+            meeting_id=self.context.meeting_id,
+        )
+        return participant.id, {
+            "agent_id": participant.id,
+            "agent_role": participant.role,
+            "agent_name": participant.name,
+            "preparation": response,
+        }
 
-Your role: {participant.role}
-Meeting type: {self.context.meeting_type}
+    def _build_prep_prompt(self, participant) -> tuple[str, str]:
+        """Build preparation prompt for a participant as (system, user) parts.
 
-Agenda items:
-{chr(10).join(f"- {item}" for item in agenda)}
-
-Please prepare:
-1. KEY_POINTS: [What you want to communicate]
-2. RECOMMENDATIONS: [Your suggested actions]
-3. CONCERNS: [Risks or issues to raise]
-4. QUESTIONS: [What you need clarified]
-5. DATA: [Facts or analysis to share]
-
-Be concise but thorough. Your preparation will be shared with other participants.
-"""
+        The system part is identical for every participant in the meeting, so
+        it stays cacheable; only the user part names the participant's role.
+        """
+        return self._system, _PREP_USER_TEMPLATE.format(role=participant.role)
 
 
 class SyncDecisionPhase:
     """Synchronous decision phase with round-robin discussion."""
 
-    def __init__(self, context: "MeetingContext"):
+    def __init__(self, context: "MeetingContext", parallel_rounds: bool = True):
         self.context = context
-        self.discussion_log: list[AgentThought] = []
-        self.decisions: list[dict[str, Any]] = []
-        self.action_items: list[dict[str, Any]] = []
+        # When set, speakers in a round answer concurrently and see only
+        # earlier rounds; otherwise each speaker also sees their own round
+        self.parallel_rounds = parallel_rounds
+        self.discussion_log: list[DiscussionEntry] = []
+        self.decisions: list[DecisionDraft] = []
+        self.action_items: list[ActionItemDraft] = []
+        # Transcript pieces, joined with blank lines only when a prompt needs them
+        self._context_parts: list[str] = []
 
     async def run(self, prep_results: dict[str, Any]) -> dict[str, Any]:
         """Run synchronous decision phase."""
-        participants = self.context.participants
+        speakers = [p for p in self.context.participants if hasattr(p, "think")]
+        system = self._build_discussion_system()
 
         # Round-robin discussion
-        discussion_context = self._build_discussion_context(prep_results)
+        self._context_parts = [self._build_discussion_context(prep_results)]
 
         for round_num in range(2):  # 2 rounds of discussion
-            for participant in participants:
-                if hasattr(participant, "think"):
+            if self.parallel_rounds:
+                base_context = "\n\n".join(self._context_parts)
+                responses = await asyncio.gather(
+                    *(
+                        _think(
+                            self.context,
+                            participant,
+                            self._build_discussion_prompt(participant, base_context, round_num),
+                            system,
+                        )
+                        for participant in speakers
+                    ),
+                    return_exceptions=True,
+                )
+                for participant, response in zip(speakers, responses):
+                    self._record(participant, response, round_num)
+            else:
+                for participant in speakers:
                     prompt = self._build_discussion_prompt(
                         participant,
-                        discussion_context,
+                        "\n\n".join(self._context_parts),
                         round_num,
                     )
                     try:
-                        response = await participant.think(prompt)
-                        thought = AgentThought(
-                            agent_id=participant.id,
-                            agent_role=participant.role,
-                            content=response,
-                            meeting_id=self.context.meeting_id,
-                        )
-                        self.discussion_log.append(thought)
-                        participant.add_thought(
-                            f"Spoke in meeting round {round_num + 1}",
-                            meeting_id=self.context.meeting_id,
-                        )
-                        discussion_context += f"\n\n{participant.name}: {response}"
+                        response = await _think(self.context, participant, prompt, system)
                     except Exception as e:
-                        discussion_context += f"\n\n{participant.name}: [Error: {e}]"
+                        response = e
+                    self._record(participant, response, round_num)
 
-        # Final synthesis by CEO or designated facilitator
+        # Final synthesis by CEO or designated facilitator. It is not started
+        # speculatively: its prompt is the whole transcript, which is only
+        # known once the last round is in, so a guessed request would never match
         facilitator = self._get_facilitator()
         if facilitator and hasattr(facilitator, "think"):
-            synthesis = await self._synthesize(facilitator, discussion_context)
-            self._extract_decisions_and_actions(synthesis)
+            await self._synthesize(facilitator, "\n\n".join(self._context_parts))
 
         return {
             "phase": MeetingPhase.SYNC_DECISION,
-            "discussion_log": [
-                {
-                    "agent_id": t.agent_id,
-                    "agent_role": t.agent_role,
-                    "content": t.content,
-                    "timestamp": t.timestamp.isoformat(),
-                }
-                for t in self.discussion_log
-            ],
+            "discussion_log": self.discussion_log,
             "decisions": self.decisions,
             "action_items": self.action_items,
         }
 
+    def _record(
+        self,
+        participant,
+        response: str | BaseException,
+        round_num: int,
+    ) -> None:
+        """Log a participant's contribution and add it to the transcript."""
+        if isinstance(response, BaseException):
+            if not isinstance(response, Exception):
+                raise response  # Cancellation and the like are not speaker errors
+            self._context_parts.append(f"{participant.name}: [Error: {response}]")
+            return
+
+        self.discussion_log.append({
+            "agent_id": participant.id,
+            "agent_role": participant.role,
+            "content": response,
+            "timestamp": datetime.utcnow().isoformat(),
+        })
+        participant.add_thought(
+            f"Spoke in meeting round {round_num + 1}",
+            meeting_id=self.context.meeting_id,
+        )
+        self._context_parts.append(f"{participant.name}: {response}")
+
     def _build_discussion_context(self, prep_results: dict[str, Any]) -> str:
         """Build context from preparation results."""
-        context = f"Meeting: {self.context.title}\n\nPreparations:\n"
-        for agent_id, result in prep_results.items():
-            if "preparation" in result:
-                context += f"\n{result['agent_name']} ({result['agent_role']}):\n{result['preparation']}\n"
-        return context
+        parts = [f"Meeting: {self.context.title}\n\nPreparations:\n"]
+        parts.extend(
+            f"\n{result['agent_name']} ({result['agent_role']}):\n{result['preparation']}\n"
+            for result in prep_results.values()
+            if "preparation" in result
+        )
+        return "".join(parts)
+
+    def _build_discussion_system(self) -> str:
+        """Instructions shared by every discussion turn in this meeting."""
+        return _DISCUSSION_SYSTEM_TEMPLATE.format(
+            title=self.context.title,
+            agenda=_render_agenda(self.context.agenda),
+        )
 
     def _build_discussion_prompt(
         self,
@@ -148,29 +315,17 @@ class SyncDecisionPhase:
         discussion_context: str,
         round_num: int,
     ) -> str:
-        """Build discussion prompt for a participant."""
-        round_focus = [
-            "Share your perspective and react to others' inputs",
-            "Focus on converging toward decisions and addressing disagreements",
-        ]
-
-        return f"""You are in a meeting: "{self.context.title}"
-Your role: {participant.role}
-Round: {round_num + 1} of 2
-
-Discussion so far:
-{discussion_context}
-
-This round, focus on: {round_focus[round_num]}
-
-Provide your contribution:
-1. REACTION: [Your response to what others said]
-2. POSITION: [Your stance on key issues]
-3. PROPOSAL: [Specific suggestions]
-4. CONCERNS: [Any remaining issues]
-
-Be constructive and aim for progress toward decisions.
-"""
+        """Build the per-turn part of a discussion prompt.
+
+        The meeting-wide instructions are sent separately as
+        ``_build_discussion_system`` so they form a stable, cacheable prefix.
+        """
+        return _DISCUSSION_TURN_TEMPLATE.format(
+            role=participant.role,
+            round=round_num + 1,
+            discussion_context=discussion_context,
+            focus=_ROUND_FOCUS[round_num],
+        )
 
     def _get_facilitator(self):
         """Get the meeting facilitator (CEO or first participant)."""
@@ -180,58 +335,54 @@ Be constructive and aim for progress toward decisions.
         return self.context.participants[0] if self.context.participants else None
 
     async def _synthesize(self, facilitator, discussion_context: str) -> str:
-        """Have facilitator synthesize the discussion."""
-        prompt = f"""As the meeting facilitator, synthesize the following discussion and produce clear outputs.
-
-Meeting: {self.context.title}
-Agenda: {self.context.agenda}
-
-Discussion:
-{discussion_context}
-
-Provide:
-1. SUMMARY: [Brief summary of key points discussed]
-2. DECISIONS: [Clear decisions made - format as "DECISION: [description]"]
-3. ACTION_ITEMS: [Specific tasks - format as "ACTION: [description] | OWNER: [role] | DEADLINE: [when]"]
-4. OPEN_QUESTIONS: [Issues not resolved]
-5. NEXT_STEPS: [What happens next]
-"""
-        return await facilitator.think(prompt)
+        """Have facilitator synthesize the discussion, extracting its outputs.
+
+        The synthesis goes through _think like every other turn, so it is
+        streamed to an on_token hook if the context has one. Decisions and
+        action items are only parsed from the complete response, so a stream
+        that fails part-way never leaves partial or duplicated drafts; an
+        on_output hook on the context is called for each one as it is parsed.
+        """
+        prompt = _SYNTHESIS_TEMPLATE.format(
+            title=self.context.title,
+            agenda=self.context.agenda,
+            discussion_context=discussion_context,
+        )
+        synthesis = await _think(self.context, facilitator, prompt)
+        self._extract_decisions_and_actions(synthesis)
+        return synthesis
 
     def _extract_decisions_and_actions(self, synthesis: str) -> None:
         """Extract structured decisions and action items from synthesis."""
-        lines = synthesis.split("\n")
-
-        for line in lines:
-            line = line.strip()
-            if line.startswith("DECISION:") or line.startswith("2. DECISION:"):
-                decision_text = line.split(":", 1)[1].strip() if ":" in line else line
-                self.decisions.append({
-                    "id": str(uuid.uuid4())[:8],
-                    "description": decision_text,
-                    "status": "proposed",
-                })
-            elif line.startswith("ACTION:") or line.startswith("3. ACTION:"):
-                action_text = line.split(":", 1)[1].strip() if ":" in line else line
-                # Parse owner and deadline if present
-                owner = "TBD"
-                deadline = "TBD"
-                if "| OWNER:" in action_text:
-                    parts = action_text.split("| OWNER:")
-                    action_desc = parts[0].strip()
-                    rest = parts[1]
-                    if "| DEADLINE:" in rest:
-                        owner = rest.split("| DEADLINE:")[0].strip()
-                        deadline = rest.split("| DEADLINE:")[1].strip()
-                    else:
-                        owner = rest.strip()
-                else:
-                    action_desc = action_text
-
-                self.action_items.append({
-                    "id": str(uuid.uuid4())[:8],
-                    "description": action_desc,
-                    "owner": owner,
-                    "deadline": deadline,
-                    "status": "todo",
-                })
+        for line in synthesis.splitlines():
+            self._extract_line(line)
+
+    def _extract_line(self, line: str) -> None:
+        """Record the decision or action item on a synthesis line, if any."""
+        match = _OUTPUT_LINE_RE.match(line.strip())
+        if not match:
+            return
+        kind, text = match.groups()
+
+        item: DecisionDraft | ActionItemDraft
+        if kind == "DECISION":
+            item = {
+                "id": secrets.token_hex(4),
+                "description": text,
+                "status": "proposed",
+            }
+            self.decisions.append(item)
+        else:
+            # Owner and deadline are optional "| OWNER: ... | DEADLINE: ..." suffixes
+            action = _ACTION_RE.match(text)
+            item = {
+                "id": secrets.token_hex(4),
+                "description": action["description"],
+                "owner": (action["owner"] or "TBD").strip(),
+                "deadline": (action["deadline"] or "TBD").strip(),
+                "status": "todo",
+            }
+            self.action_items.append(item)
+
+        if self.context.on_output is not None:
+            self.context.on_output(kind, item)
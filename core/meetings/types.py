@@ -1,6 +1,7 @@
 """Types and enums for meetings."""
 
 from enum import Enum
+from typing import TypedDict
 
 
 class MeetingType(str, Enum):
@@ -28,3 +29,30 @@ class MeetingStatus(str, Enum):
     PAUSED = "paused"
     COMPLETED = "completed"
     CANCELLED = "cancelled"
+
+
+class DiscussionEntry(TypedDict):
+    """One contribution to a meeting discussion."""
+
+    agent_id: str
+    agent_role: str
+    content: str
+    timestamp: str
+
+
+class DecisionDraft(TypedDict):
+    """A decision extracted from a meeting synthesis, before it is saved."""
+
+    id: str
+    description: str
+    status: str
+
+
+class ActionItemDraft(TypedDict):
+    """An action item extracted from a meeting synthesis, before it is saved."""
+
+    id: str
+    description: str
+    owner: str
+    deadline: str
+    status: str
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import heapq
+from collections import defaultdict
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any, Optional
 
 from ..artifacts.models import (
@@ -29,11 +32,21 @@ class WorkspaceState:
         self.pending_decisions: list[Decision] = []
         self.open_action_items: list[ActionItem] = []
         self.agents: dict[str, "BaseAgent"] = {}
+        # Flat id/role/name projection served to listings without touching
+        # the agents; per-agent reads elsewhere are cheap slot lookups
+        self._agent_summaries: list[dict[str, str]] = []
+        # Lookup indexes kept in step with the lists/dicts above
+        self._agents_by_role: defaultdict[str, list["BaseAgent"]] = defaultdict(list)
+        self._initiatives_by_id: dict[str, Initiative] = {}
+        # Most recent meetings, keyed by (store meeting version, limit)
+        self._recent_meetings: list[MeetingLog] = []
+        self._recent_meetings_key: tuple[int, int] | None = None
         self._load_state()
 
     def _load_state(self) -> None:
         """Load current state from store."""
         self.active_initiatives = self.store.list_all("initiative", Initiative)
+        self._initiatives_by_id = {i.id: i for i in self.active_initiatives}
         self.active_meetings = [
             m for m in self.store.list_all("meeting", MeetingLog)
             if not m.completed_at
@@ -46,7 +59,17 @@ class WorkspaceState:
 
     def register_agent(self, agent: "BaseAgent") -> None:
         """Register an agent in the workspace."""
+        previous = self.agents.get(agent.id)
+        if previous is None:
+            self._agent_summaries.append(agent.summary())
+        else:
+            self._agents_by_role[previous.role].remove(previous)
         self.agents[agent.id] = agent
+        self._agents_by_role[agent.role].append(agent)
+
+    def get_agent_summaries(self) -> list[dict[str, str]]:
+        """Get the id/role/name listing of registered agents."""
+        return self._agent_summaries
 
     def get_agent(self, agent_id: str) -> Optional["BaseAgent"]:
         """Get an agent by ID."""
@@ -54,18 +77,19 @@ class WorkspaceState:
 
     def get_agents_by_role(self, role: str) -> list["BaseAgent"]:
         """Get all agents with a specific role."""
-        return [a for a in self.agents.values() if a.role == role]
+        return list(self._agents_by_role.get(role, ()))
 
     def add_initiative(self, initiative: Initiative) -> None:
         """Add a new initiative."""
         self.active_initiatives.append(initiative)
+        self._initiatives_by_id[initiative.id] = initiative
         self.store.save("initiative", initiative.id, initiative)
 
     def get_initiative(self, initiative_id: str) -> Optional[Initiative]:
         """Get an initiative by ID."""
-        for i in self.active_initiatives:
-            if i.id == initiative_id:
-                return i
+        initiative = self._initiatives_by_id.get(initiative_id)
+        if initiative is not None:
+            return initiative
         return self.store.load("initiative", initiative_id, Initiative)
 
     def get_snapshot(self) -> WorkspaceSnapshot:
@@ -73,30 +97,39 @@ class WorkspaceState:
         return WorkspaceSnapshot(
             active_initiatives=self.active_initiatives,
             pending_decisions=self.pending_decisions,
-            recent_meetings=sorted(
-                self.store.list_all("meeting", MeetingLog),
-                key=lambda m: m.started_at,
-                reverse=True,
-            )[:10],
+            recent_meetings=self.get_recent_meetings(),
             open_action_items=self.open_action_items,
         )
 
+    def get_recent_meetings(self, limit: int = 10) -> list[MeetingLog]:
+        """Get the most recently started meetings, newest first.
+
+        The result is cached until a meeting is saved or deleted.
+        """
+        key = (self.store.version("meeting"), limit)
+        if key != self._recent_meetings_key:
+            self._recent_meetings = heapq.nlargest(
+                limit,
+                self.store.list_all("meeting", MeetingLog),
+                key=attrgetter("started_at"),
+            )
+            self._recent_meetings_key = key
+        return list(self._recent_meetings)
+
     def get_metrics(self) -> dict[str, Any]:
         """Get workspace metrics."""
-        all_decisions = self.decision_registry.list_all()
+        # Action items are only counted, meetings are loaded once for both
+        # meeting figures, and decisions come from the registry's cache
         all_meetings = self.store.list_all("meeting", MeetingLog)
-        all_actions = self.store.list_all("action_item", ActionItem)
-
-        completed_meetings = [m for m in all_meetings if m.completed_at]
 
         return {
             "agents": len(self.agents),
             "active_initiatives": len(self.active_initiatives),
             "total_meetings": len(all_meetings),
-            "completed_meetings": len(completed_meetings),
-            "total_decisions": len(all_decisions),
+            "completed_meetings": sum(1 for m in all_meetings if m.completed_at),
+            "total_decisions": self.decision_registry.count(),
             "pending_decisions": len(self.pending_decisions),
-            "total_action_items": len(all_actions),
+            "total_action_items": self.store.count("action_item"),
             "open_action_items": len(self.open_action_items),
             "decision_metrics": self.decision_registry.get_metrics(),
         }
@@ -9,7 +9,7 @@ This script demonstrates the core functionality of DeamCompan:
 
 import asyncio
 import os
-from datetime import datetime
+import sys
 
 # Load environment variables from .env file
 from dotenv import load_dotenv
@@ -28,17 +28,56 @@ from core.meetings.engine import MeetingEngine
 from core.meetings.types import MeetingType
 from core.workspace.state import WorkspaceState
 
+DEMO_LLM_CACHE = "./demo_workspace/llm_cache.json"
+
+RULE = "=" * 60
+DIVIDER = "-" * 60
+
+METRICS_TEMPLATE = """Agents: {agents}
+Active Initiatives: {active_initiatives}
+Total Meetings: {total_meetings}
+Pending Decisions: {pending_decisions}
+Open Action Items: {open_action_items}"""
+
+MEETING_TEMPLATE = """Meeting ID: {meeting_id}
+Title: {title}
+Participants: {participants}
+"""
+
+# Canned replies for mock mode, matched against the end of each prompt
+MOCK_RESPONSES = {
+    "As the meeting facilitator": """SUMMARY: The team agreed to focus Q1 on an AI analytics MVP.
+DECISION: Focus on AI-powered analytics product
+DECISION: Launch MVP by end of Q1
+ACTION: Conduct user research | OWNER: Product | DEADLINE: 2 weeks
+ACTION: Design technical architecture | OWNER: Engineering | DEADLINE: 3 weeks
+""",
+    "Your role: Strategy": "KEY_POINTS: Market analysis complete",
+    "Your role: Product": "KEY_POINTS: Feature priorities identified",
+    "Your role: Engineering": "KEY_POINTS: Technical feasibility assessed",
+}
+
 
 async def main():
     """Run the DeamCompan demo."""
-    print("=" * 60)
+    print(RULE)
     print("DeamCompan Demo - Virtual Company Workspace")
-    print("=" * 60)
+    print(RULE)
     print()
 
     # Initialize multi-client
     print("🔌 Initializing LLM providers...")
     multi_client = MultiClient()
+    try:
+        await run_demo(multi_client)
+    finally:
+        # Release the shared provider connections before the event loop closes,
+        # even when the demo is interrupted or fails
+        await multi_client.close()
+
+
+async def run_demo(multi_client: MultiClient):
+    """Run the demo workspace and meeting on an initialized client."""
     providers = multi_client.get_available_providers()
     
     if not providers:
@@ -56,6 +95,8 @@ async def main():
         print("⚠️  This will make actual LLM calls and may take a few minutes.")
         print("    Auto-switch will try alternative providers on failure.")
         print()
+        # Connect to providers while the workspace is being set up
+        prewarm = asyncio.create_task(multi_client.prewarm())
 
     # Initialize storage
     print("📁 Initializing workspace...")
@@ -69,20 +110,25 @@ async def main():
     # Create agents
     print("🤖 Creating agents...")
 
+    # Each mode imports only the client wrapper it uses
     if use_mock:
-        # Create agents without LLM for demo
-        bod = BoardOfDirectors(None, "Board of Directors")
-        ceo = CEOOrchestrator(None, "CEO")
-        strategy = StrategyExpert(None, "Strategy Expert")
-        product = ProductExpert(None, "Product Expert")
-        engineering = EngineeringExpert(None, "Engineering Expert")
+        from core.llm.mock import MockLLMClient
+
+        # Canned responses let the whole meeting pipeline run offline
+        llm = MockLLMClient(MOCK_RESPONSES)
     else:
-        # Create agents with MultiClient (auto-switch support)
-        bod = BoardOfDirectors(multi_client, "Board of Directors")
-        ceo = CEOOrchestrator(multi_client, "CEO")
-        strategy = StrategyExpert(multi_client, "Strategy Expert")
-        product = ProductExpert(multi_client, "Product Expert")
-        engineering = EngineeringExpert(multi_client, "Engineering Expert")
+        from core.llm.cache import CachedClient, FileCache, LLMCache
+
+        # Create agents with MultiClient (auto-switch support). Responses are
+        # kept on disk so re-running the demo replays identical prompts for free
+        llm = CachedClient(multi_client, LLMCache(FileCache(DEMO_LLM_CACHE)))
+        print(f"  (LLM responses cached in {DEMO_LLM_CACHE}; delete it to refresh)")
+
+    bod = BoardOfDirectors(llm, "Board of Directors")
+    ceo = CEOOrchestrator(llm, "CEO")
+    strategy = StrategyExpert(llm, "Strategy Expert")
+    product = ProductExpert(llm, "Product Expert")
+    engineering = EngineeringExpert(llm, "Engineering Expert")
 
     # Register agents in workspace
     workspace.register_agent(bod)
@@ -114,8 +160,9 @@ async def main():
 
     # Run a strategic planning meeting
     print("📅 Running Strategic Planning Meeting...")
-    print("-" * 60)
+    print(DIVIDER)
 
+    participants = [ceo, strategy, product, engineering]
     meeting = await meeting_engine.create_meeting(
         title="Q1 Strategic Planning",
         meeting_type=MeetingType.EXECUTIVE_REVIEW,
@@ -125,101 +172,89 @@ async def main():
             "Prioritize initiatives for Q1",
             "Assign action items",
         ],
-        participants=[ceo, strategy, product, engineering],
+        participants=participants,
+        # Every participant can prepare and speak at once
+        max_concurrency=len(participants),
     )
 
-    print(f"Meeting ID: {meeting.meeting_id}")
-    print(f"Title: {meeting.title}")
-    print(f"Participants: {', '.join(p.name for p in meeting.participants)}")
-    print()
+    print(MEETING_TEMPLATE.format(
+        meeting_id=meeting.meeting_id,
+        title=meeting.title,
+        participants=", ".join(p.name for p in meeting.participants),
+    ))
 
     if use_mock:
-        print("📝 Mock mode - simulating meeting without LLM calls")
-        print()
-        print("Phase 1: Async Preparation")
-        print("  - Each expert prepares their input...")
-        print("  - Strategy: Market analysis complete")
-        print("  - Product: Feature priorities identified")
-        print("  - Engineering: Technical feasibility assessed")
-        print()
-        print("Phase 2: Synchronous Decision")
-        print("  - Round 1: Initial perspectives shared")
-        print("  - Round 2: Convergence on key decisions")
-        print()
-        print("Decisions made:")
-        print("  1. DECISION: Focus on AI-powered analytics product")
-        print("  2. DECISION: Launch MVP by end of Q1")
-        print()
-        print("Action items:")
-        print("  - ACTION: Conduct user research | OWNER: Product | DEADLINE: 2 weeks")
-        print("  - ACTION: Design technical architecture | OWNER: Engineering | DEADLINE: 3 weeks")
+        print("📝 Mock mode - running the meeting on canned responses")
         print()
     else:
         # Run actual meeting with LLM
         print("🤖 Running meeting with LLM...")
         print("   (This may take 2-3 minutes depending on model speed)")
         print()
-        try:
-            result = await meeting_engine.run_meeting(meeting.meeting_id)
+        sys.stdout.flush()  # Show progress so far before the long wait
+        await prewarm
+
+    # Show decisions and action items as soon as the synthesis is parsed
+    def show_output(kind, item):
+        print(f"   {kind}: {item['description'][:80]}", flush=True)
+
+    meeting.on_output = show_output
+    try:
+        result = await meeting_engine.run_meeting(meeting.meeting_id)
+
+        print("Phase 1: Async Preparation Complete ✅")
+        print()
+        print("Phase 2: Synchronous Decision Complete ✅")
+        print()
+
+        if "decision_results" in result:
+            decisions = result["decision_results"].get("decisions", [])
+            actions = result["decision_results"].get("action_items", [])
+
+            print(f"Decisions made: {len(decisions)}")
+            for d in decisions:
+                print(f"  - {d['description'][:80]}...")
 
-            print("Phase 1: Async Preparation Complete ✅")
-            print()
-            print("Phase 2: Synchronous Decision Complete ✅")
             print()
+            print(f"Action items: {len(actions)}")
+            for a in actions:
+                print(f"  - {a['description'][:60]}... (Owner: {a['owner']})")
+    except MultiClientError as e:
+        print(f"❌ All providers failed:")
+        for provider, error in e.errors.items():
+            print(f"   - {provider}: {error[:80]}")
+        print("   The meeting simulation was incomplete.")
+    except Exception as e:
+        print(f"❌ Error during meeting: {e}")
+        print("   The meeting simulation was incomplete.")
 
-            if "decision_results" in result:
-                decisions = result["decision_results"].get("decisions", [])
-                actions = result["decision_results"].get("action_items", [])
-
-                print(f"Decisions made: {len(decisions)}")
-                for d in decisions:
-                    print(f"  - {d['description'][:80]}...")
-
-                print()
-                print(f"Action items: {len(actions)}")
-                for a in actions:
-                    print(f"  - {a['description'][:60]}... (Owner: {a['owner']})")
-        except MultiClientError as e:
-            print(f"❌ All providers failed:")
-            for provider, error in e.errors.items():
-                print(f"   - {provider}: {error[:80]}")
-            print("   The meeting simulation was incomplete.")
-        except Exception as e:
-            print(f"❌ Error during meeting: {e}")
-            print("   The meeting simulation was incomplete.")
-
-    print("-" * 60)
+    print(DIVIDER)
     print("✅ Meeting completed")
     print()
 
     # Show workspace metrics
     print("📊 Workspace Metrics")
-    print("-" * 60)
-    metrics = workspace.get_metrics()
-    print(f"Agents: {metrics['agents']}")
-    print(f"Active Initiatives: {metrics['active_initiatives']}")
-    print(f"Total Meetings: {metrics['total_meetings']}")
-    print(f"Pending Decisions: {metrics['pending_decisions']}")
-    print(f"Open Action Items: {metrics['open_action_items']}")
-    print("-" * 60)
+    print(DIVIDER)
+    print(METRICS_TEMPLATE.format_map(workspace.get_metrics()))
+    print(DIVIDER)
     print()
 
     # Show decision registry
     print("📋 Decision Registry")
-    print("-" * 60)
-    decisions = registry.list_all()
+    print(DIVIDER)
+    decisions = registry.list_recent(5)
     if decisions:
-        for d in decisions[:5]:
+        for d in decisions:
             status_icon = "✅" if d.status == "approved" else "⏳" if d.status == "pending" else "📝"
             print(f"{status_icon} [{d.status.upper()}] {d.title}")
     else:
         print("No decisions recorded yet.")
-    print("-" * 60)
+    print(DIVIDER)
     print()
 
-    print("=" * 60)
+    print(RULE)
     print("Demo completed!")
-    print("=" * 60)
+    print(RULE)
     print()
     print("Next steps:")
     print("  1. Start the API server: uvicorn api.main:app --reload")
@@ -229,4 +264,12 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Block-buffer output even on a terminal; main() flushes before long waits
+    sys.stdout.reconfigure(line_buffering=False)
+    # uvloop (if installed) trims event-loop overhead on the many HTTPS round-trips
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
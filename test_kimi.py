@@ -1,12 +1,12 @@
 """Test script để kiểm tra Kimi API."""
 
 import asyncio
-import os
 from dotenv import load_dotenv
 
 # Load .env file
 load_dotenv()
 
+from core.config import get_config
 from core.llm.factory import LLMClientFactory
 from core.llm.base import LLMMessage
 
@@ -19,12 +19,12 @@ async def main():
     print()
     
     # Kiểm tra environment variables
-    api_key = os.getenv("OPENAI_API_KEY")
-    base_url = os.getenv("OPENAI_BASE_URL")
-    default_model = os.getenv("DEFAULT_MODEL", "kimi-k2.5")
+    config = get_config()
+    api_key = config.openai_key
+    default_model = config.model
     
     print(f"API Key: {api_key[:10]}..." if api_key else "Not set")
-    print(f"Base URL: {base_url}")
+    print(f"Base URL: {config.base_url}")
     print(f"Default Model: {default_model}")
     print()
     
@@ -51,6 +51,8 @@ async def main():
         print(f"❌ Error: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        await LLMClientFactory.close_all()
 
 
 if __name__ == "__main__":
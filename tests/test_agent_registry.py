@@ -0,0 +1,65 @@
+"""The API's copy-on-write AgentRegistry."""
+
+import threading
+
+from api.routes.agents import AgentRegistry
+from core.agents.ceo import CEOOrchestrator
+from core.agents.experts.strategy import StrategyExpert
+from core.llm.mock import MockLLMClient
+
+
+def test_register_and_list():
+    registry = AgentRegistry()
+    ceo = CEOOrchestrator(MockLLMClient())
+    strategy = StrategyExpert(MockLLMClient(), name="Planner")
+    registry.register(ceo)
+    registry.register(strategy)
+
+    assert registry.get(ceo.id) is ceo
+    assert registry[strategy.id] is strategy
+    assert registry.get("missing") is None
+    assert set(registry.keys()) == {ceo.id, strategy.id}
+    assert list(registry.summaries()) == [
+        {"id": ceo.id, "role": "CEO", "name": "CEO"},
+        {"id": strategy.id, "role": "Strategy", "name": "Planner"},
+    ]
+
+
+def test_views_taken_before_a_register_are_unchanged():
+    registry = AgentRegistry()
+    first = CEOOrchestrator(MockLLMClient())
+    registry.register(first)
+
+    summaries, keys = registry.summaries(), registry.keys()
+    registry.register(StrategyExpert(MockLLMClient()))
+
+    assert [s["id"] for s in summaries] == [first.id]
+    assert list(keys) == [first.id]
+    assert len(registry.summaries()) == 2
+
+
+def test_readers_iterate_safely_during_concurrent_registers():
+    registry = AgentRegistry()
+    errors: list[BaseException] = []
+    done = threading.Event()
+
+    def read():
+        while not done.is_set():
+            try:
+                for summary in registry.summaries():
+                    summary["id"]
+            except RuntimeError as e:  # "dictionary changed size during iteration"
+                errors.append(e)
+                return
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for _ in range(500):
+        registry.register(StrategyExpert(MockLLMClient()))
+    done.set()
+    for reader in readers:
+        reader.join()
+
+    assert errors == []
+    assert len(registry.summaries()) == 500
@@ -0,0 +1,110 @@
+"""ArtifactStore batch writes."""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pydantic import BaseModel, ConfigDict
+from pydantic_core import PydanticSerializationError
+
+from core.artifacts.models import ActionItem, Decision
+from core.artifacts.store import ArtifactStore
+
+
+class Unserializable(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    value: object
+
+
+def _decision(decision_id: str) -> Decision:
+    return Decision(
+        id=decision_id, title="t", description="d", rationale="r", proposed_by="test"
+    )
+
+
+def _batch() -> list[tuple[str, str, BaseModel]]:
+    return [
+        ("decision", "d1", _decision("d1")),
+        ("decision", "d2", _decision("d2")),
+        ("action_item", "a1", ActionItem(id="a1", description="do it", owner="CEO", meeting_id="m1")),
+    ]
+
+
+def _files(store: ArtifactStore) -> list[str]:
+    return sorted(p.name for p in store.artifacts_path.rglob("*") if p.is_file())
+
+
+def test_save_many_writes_everything_and_bumps_each_type_once(tmp_path):
+    store = ArtifactStore(str(tmp_path))
+    store.save_many(_batch())
+
+    assert _files(store) == ["a1.json", "d1.json", "d2.json"]
+    assert store.load("decision", "d2", Decision).id == "d2"
+    assert store.load("action_item", "a1", ActionItem).owner == "CEO"
+    assert store.version("decision") == 1
+    assert store.version("action_item") == 1
+
+
+def test_save_many_writes_nothing_if_any_item_fails_to_serialize(tmp_path):
+    store = ArtifactStore(str(tmp_path))
+    batch = [*_batch(), ("decision", "bad", Unserializable(value=object()))]
+
+    with pytest.raises(PydanticSerializationError):
+        store.save_many(batch)
+
+    assert _files(store) == []
+    assert store.version("decision") == 0
+
+
+def test_asave_many_matches_save_many(tmp_path):
+    store = ArtifactStore(str(tmp_path))
+    asyncio.run(store.asave_many(_batch()))
+
+    assert _files(store) == ["a1.json", "d1.json", "d2.json"]
+    assert store.load("decision", "d1", Decision).id == "d1"
+    assert store.version("decision") == 1
+    assert store.version("action_item") == 1
+
+
+def test_asave_many_serializes_before_writing(tmp_path):
+    store = ArtifactStore(str(tmp_path))
+    batch = [*_batch(), ("decision", "bad", Unserializable(value=object()))]
+
+    with pytest.raises(PydanticSerializationError):
+        asyncio.run(store.asave_many(batch))
+
+    assert _files(store) == []
+
+
+def test_save_many_sync_fsyncs_each_file_and_directory(tmp_path, monkeypatch):
+    store = ArtifactStore(str(tmp_path))
+    synced: list[int] = []
+    fsync = os.fsync
+
+    def record(fd):
+        synced.append(fd)
+        fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", record)
+    store.save_many(_batch(), sync=True)
+
+    # Three files, then the decisions and action_items directories
+    assert len(synced) == 5
+    assert _files(store) == ["a1.json", "d1.json", "d2.json"]
+
+
+def test_concurrent_writes_of_one_artifact_stay_whole(tmp_path):
+    store = ArtifactStore(str(tmp_path))
+    titles = [f"title {i} " + "x" * 20_000 for i in range(8)]
+
+    def write(title):
+        for _ in range(20):
+            store.save("decision", "d1", _decision("d1").model_copy(update={"title": title}))
+
+    with ThreadPoolExecutor(max_workers=len(titles)) as pool:
+        list(pool.map(write, titles))
+
+    assert store.load("decision", "d1", Decision).title in titles
+    assert _files(store) == ["d1.json"]
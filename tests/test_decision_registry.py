@@ -0,0 +1,136 @@
+"""DecisionRegistry's in-memory cache and status index."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from pydantic import ValidationError
+
+from core.artifacts.models import Decision, DecisionStatus
+from core.artifacts.registry import DecisionRegistry
+from core.artifacts.store import ArtifactStore
+
+
+def _decision(decision_id: str, status=DecisionStatus.PROPOSED, **fields) -> Decision:
+    return Decision(
+        id=decision_id,
+        title=f"Decision {decision_id}",
+        description="",
+        rationale="",
+        proposed_by="test",
+        status=status,
+        **fields,
+    )
+
+
+@pytest.fixture
+def store(tmp_path) -> ArtifactStore:
+    return ArtifactStore(str(tmp_path))
+
+
+def test_registry_sees_decisions_saved_through_the_store(store):
+    registry = DecisionRegistry(store)
+    registry.register(_decision("a"))
+    assert registry.count() == 1
+
+    # Written behind the registry's back: the store version moves, so it reloads
+    store.save("decision", "b", _decision("b"))
+    assert {d.id for d in registry.list_all()} == {"a", "b"}
+
+    store.delete("decision", "a")
+    assert registry.get("a") is None
+    assert registry.count() == 1
+
+
+def test_registry_loads_existing_decisions(store):
+    store.save_many([("decision", i, _decision(i)) for i in ("a", "b", "c")])
+    registry = DecisionRegistry(store)
+    assert registry.count() == 3
+    assert registry.get("b").title == "Decision b"
+
+
+def test_registries_share_one_store(store):
+    first, second = DecisionRegistry(store), DecisionRegistry(store)
+    assert first.count() == 0
+    second.register(_decision("a"))
+    assert first.get("a") is not None
+
+
+def test_update_status_moves_decision_between_status_lists(store):
+    registry = DecisionRegistry(store)
+    for decision_id in ("a", "b", "c"):
+        registry.register(_decision(decision_id))
+
+    registry.update_status("a", DecisionStatus.APPROVED, approved_by="CEO")
+    registry.update_status("b", DecisionStatus.REJECTED)
+
+    assert [d.id for d in registry.list_proposed()] == ["c"]
+    assert [d.id for d in registry.list_approved()] == ["a"]
+    assert registry.list_pending() == []
+    assert registry.get("a").approved_by == "CEO"
+    assert registry.update_status("missing", DecisionStatus.APPROVED) is None
+
+    metrics = registry.get_metrics()
+    assert metrics["total"] == 3
+    assert metrics["by_status"] == {
+        DecisionStatus.PROPOSED: 1,
+        DecisionStatus.APPROVED: 1,
+        DecisionStatus.REJECTED: 1,
+    }
+    assert metrics["approval_rate"] == 0.5
+
+
+def test_status_index_rebuilds_after_outside_write(store):
+    registry = DecisionRegistry(store)
+    registry.register(_decision("a"))
+    assert [d.id for d in registry.list_proposed()] == ["a"]
+
+    store.save("decision", "a", _decision("a", DecisionStatus.PENDING))
+    assert registry.list_proposed() == []
+    assert [d.id for d in registry.list_pending()] == ["a"]
+
+
+def test_empty_registry_metrics(store):
+    assert DecisionRegistry(store).get_metrics() == {
+        "total": 0,
+        "by_status": {},
+        "approval_rate": 0.0,
+    }
+
+
+def test_list_recent_returns_newest_first(store):
+    registry = DecisionRegistry(store)
+    start = datetime(2025, 1, 1)
+    for day in (3, 1, 4, 2, 5):
+        registry.register(_decision(f"d{day}", created_at=start + timedelta(days=day)))
+
+    assert [d.id for d in registry.list_recent(3)] == ["d5", "d4", "d3"]
+    assert len(registry.list_recent(10)) == 5
+    assert registry.list_recent(0) == []
+
+
+def test_failed_save_leaves_cache_and_index_unchanged(store, monkeypatch):
+    registry = DecisionRegistry(store)
+    registry.register(_decision("a"))
+
+    def fail(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(store, "save", fail)
+    with pytest.raises(OSError):
+        registry.update_status("a", DecisionStatus.APPROVED, approved_by="CEO")
+
+    assert registry.get("a").status == DecisionStatus.PROPOSED
+    assert registry.get("a").approved_by is None
+    assert [d.id for d in registry.list_proposed()] == ["a"]
+    assert registry.list_approved() == []
+
+
+def test_cached_decisions_are_read_only(store):
+    registry = DecisionRegistry(store)
+    registry.register(_decision("a"))
+
+    with pytest.raises(ValidationError):
+        registry.get("a").title = "changed"
+    updated = registry.update_status("a", DecisionStatus.APPROVED)
+    assert registry.get("a") is updated
+    assert registry.get("a").title == "Decision a"
@@ -0,0 +1,97 @@
+"""FileCache persistence and eviction, and CachedClient replays."""
+
+import asyncio
+
+from core.llm.cache import CachedClient, FileCache, LLMCache
+from core.llm.mock import MockLLMClient
+
+MESSAGES = [{"role": "user", "content": "hello"}]
+
+
+class CountingClient(MockLLMClient):
+    """Mock client that counts the requests it actually answers."""
+
+    __slots__ = ("calls",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+
+    async def complete(self, messages, temperature=0.7, max_tokens=None):
+        self.calls += 1
+        return await super().complete(messages, temperature, max_tokens)
+
+    async def stream(self, messages, temperature=0.7, max_tokens=None):
+        self.calls += 1
+        async for chunk in super().stream(messages, temperature, max_tokens):
+            yield chunk
+
+
+def test_file_cache_evicts_least_recently_used(tmp_path):
+    path = tmp_path / "cache.json"
+    cache = FileCache(path, maxsize=2)
+
+    async def run():
+        await cache.set("a", {"v": 1})
+        await cache.set("b", {"v": 2})
+        await cache.get("a")  # "b" is now the least recently used
+        await cache.set("c", {"v": 3})
+
+    asyncio.run(run())
+
+    reloaded = FileCache(path, maxsize=2)
+    assert asyncio.run(reloaded.get("b")) is None
+    assert asyncio.run(reloaded.get("a")) == {"v": 1}
+    assert asyncio.run(reloaded.get("c")) == {"v": 3}
+
+
+def test_file_cache_persists_concurrent_sets(tmp_path):
+    path = tmp_path / "cache.json"
+    cache = FileCache(path, maxsize=50)
+
+    async def run():
+        await asyncio.gather(*(cache.set(str(i), {"v": i}) for i in range(100)))
+
+    asyncio.run(run())
+
+    reloaded = FileCache(path, maxsize=50)
+    assert len(reloaded._entries) == 50
+    assert asyncio.run(reloaded.get("99")) == {"v": 99}
+    assert asyncio.run(reloaded.get("0")) is None
+
+
+def test_file_cache_ignores_a_corrupt_file(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text("{not json")
+    assert asyncio.run(FileCache(path).get("a")) is None
+
+
+def test_cached_client_replays_complete_and_stream(tmp_path):
+    client = CountingClient(default="line one\nline two\n")
+    cached = CachedClient(client, LLMCache(FileCache(tmp_path / "cache.json")))
+
+    async def run():
+        first = await cached.complete(MESSAGES)
+        second = await cached.complete(MESSAGES)
+        assert first.content == second.content == "line one\nline two\n"
+
+        streamed = [c async for c in cached.stream(MESSAGES, temperature=0.0)]
+        replayed = [c async for c in cached.stream(MESSAGES, temperature=0.0)]
+        assert streamed == ["line one\n", "line two\n"]
+        assert replayed == ["line one\nline two\n"]
+
+    asyncio.run(run())
+    assert client.calls == 2
+
+
+def test_cached_client_keys_on_the_wrapped_model():
+    cache = LLMCache()
+    first = CountingClient(default="from first", model="model-a")
+    second = CountingClient(default="from second", model="model-b")
+
+    async def run():
+        await CachedClient(first, cache).complete(MESSAGES)
+        return await CachedClient(second, cache).complete(MESSAGES)
+
+    assert asyncio.run(run()).content == "from second"
+    assert second.calls == 1
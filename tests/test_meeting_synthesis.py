@@ -0,0 +1,218 @@
+"""Meeting synthesis extraction and mid-stream provider failures."""
+
+import asyncio
+
+import pytest
+
+from core.agents.ceo import CEOOrchestrator
+from core.agents.experts.strategy import StrategyExpert
+from core.artifacts.models import ActionItem, Decision
+from core.artifacts.store import ArtifactStore
+from core.llm.mock import MockLLMClient
+from core.llm.multi_client import MultiClient, MultiClientError
+from core.llm.provider_manager import ProviderManager
+from core.llm.provider_types import ProviderConfig
+from core.meetings.engine import MeetingContext, MeetingEngine
+from core.meetings.phases import SyncDecisionPhase
+from core.meetings.types import MeetingType
+
+SYNTHESIS = """SUMMARY: We talked.
+DECISION: Ship the beta
+2. ACTION: Write the launch post | OWNER: CEO | DEADLINE: Friday
+ACTION: Book the venue
+"""
+
+
+class FailingStreamClient(MockLLMClient):
+    """Mock that streams the first two lines of its reply, then drops the connection."""
+
+    async def stream(self, messages, temperature=0.7, max_tokens=None):
+        lines = self._reply(messages).splitlines(keepends=True)
+        for line in lines[:2]:
+            yield line
+        raise ConnectionError("connection reset mid-stream")
+
+
+class MockMultiClient(MultiClient):
+    """MultiClient whose providers are mock clients, keyed by provider id."""
+
+    def __init__(self, provider_manager, clients):
+        super().__init__(provider_manager)
+        self.clients = clients
+
+    def _create_client(self, provider):
+        return self.clients[provider.id]
+
+
+def _multi_client(tmp_path, clients) -> MockMultiClient:
+    manager = ProviderManager(tmp_path / "providers.json")
+    manager.load_config().settings.retry_delay = 0.0
+    manager.remove_provider("kimi-proxypal")
+    for priority, provider_id in enumerate(clients, start=1):
+        manager.add_provider(ProviderConfig(
+            id=provider_id,
+            name=provider_id,
+            type="openai",
+            api_key="test",
+            default_model="mock",
+            priority=priority,
+        ))
+    return MockMultiClient(manager, clients)
+
+
+async def _collect(stream) -> str:
+    return "".join([chunk async for chunk in stream])
+
+
+def test_stream_does_not_switch_provider_after_first_chunk(tmp_path):
+    client = _multi_client(tmp_path, {
+        "a": FailingStreamClient(default="from a\nmore from a\n"),
+        "b": MockLLMClient(default="from b\n"),
+    })
+
+    chunks: list[str] = []
+
+    async def consume():
+        async for chunk in client.stream([{"role": "user", "content": "hi"}]):
+            chunks.append(chunk)
+
+    with pytest.raises(MultiClientError):
+        asyncio.run(consume())
+    assert "from b" not in "".join(chunks)
+
+
+def test_stream_switches_provider_before_first_chunk(tmp_path):
+    class DeadClient(MockLLMClient):
+        async def stream(self, messages, temperature=0.7, max_tokens=None):
+            raise ConnectionError("refused")
+            yield
+
+    client = _multi_client(tmp_path, {
+        "a": DeadClient(),
+        "b": MockLLMClient(default="from b\n"),
+    })
+    text = asyncio.run(_collect(client.stream([{"role": "user", "content": "hi"}])))
+    assert text == "from b\n"
+
+
+def test_stream_retries_before_first_chunk_within_the_limiter(tmp_path):
+    class FlakyClient(MockLLMClient):
+        __slots__ = ("attempts",)
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.attempts = 0
+
+        async def stream(self, messages, temperature=0.7, max_tokens=None):
+            self.attempts += 1
+            if self.attempts == 1:
+                raise ConnectionError("refused")
+            async for chunk in super().stream(messages, temperature, max_tokens):
+                yield chunk
+
+    flaky = FlakyClient(default="from a\n")
+    client = _multi_client(tmp_path, {"a": flaky, "b": MockLLMClient(default="from b\n")})
+    text = asyncio.run(_collect(client.stream([{"role": "user", "content": "hi"}])))
+
+    assert text == "from a\n"
+    assert flaky.attempts == 2
+    limiter = client.provider_manager.get_limiter(client.provider_manager.get_provider("a"))
+    assert len(limiter._requests) == 2  # Both attempts went through the RPM window
+    assert limiter.in_flight == 0
+
+
+def _run_meeting(tmp_path, llm, on_output=None):
+    store = ArtifactStore(str(tmp_path / "workspace"))
+    engine = MeetingEngine(store)
+    participants = [CEOOrchestrator(llm_client=llm), StrategyExpert(llm_client=llm)]
+
+    async def run():
+        meeting = await engine.create_meeting(
+            "Launch", MeetingType.DECISION_MEETING, ["Beta launch"], participants
+        )
+        meeting.on_output = on_output
+        return await engine.run_meeting(meeting.meeting_id)
+
+    return store, asyncio.run(run())
+
+
+def test_synthesis_outputs_survive_mid_stream_failure(tmp_path):
+    # Streaming would fail part-way, so on_output must not depend on it
+    llm = _multi_client(tmp_path, {
+        "a": FailingStreamClient(responses={"synthesize": SYNTHESIS}),
+        "b": MockLLMClient(responses={"synthesize": SYNTHESIS}),
+    })
+    seen: list[tuple[str, str]] = []
+    store, result = _run_meeting(
+        tmp_path, llm, lambda kind, item: seen.append((kind, item["description"]))
+    )
+
+    decisions = result["decision_results"]["decisions"]
+    actions = result["decision_results"]["action_items"]
+    assert [d["description"] for d in decisions] == ["Ship the beta"]
+    assert [(a["description"], a["owner"], a["deadline"]) for a in actions] == [
+        ("Write the launch post", "CEO", "Friday"),
+        ("Book the venue", "TBD", "TBD"),
+    ]
+    assert seen == [
+        ("DECISION", "Ship the beta"),
+        ("ACTION", "Write the launch post"),
+        ("ACTION", "Book the venue"),
+    ]
+
+    assert store.load("decision", decisions[0]["id"], Decision).description == "Ship the beta"
+    for action in actions:
+        assert store.load("action_item", action["id"], ActionItem).owner == action["owner"]
+
+
+def _phase(on_output=None) -> SyncDecisionPhase:
+    context = MeetingContext(
+        meeting_id="m1",
+        title="Launch",
+        meeting_type=MeetingType.DECISION_MEETING,
+        agenda=["Beta launch"],
+        on_output=on_output,
+    )
+    return SyncDecisionPhase(context)
+
+
+def test_extract_parses_numbered_lines_and_optional_fields():
+    phase = _phase()
+    phase._extract_decisions_and_actions(
+        "1. DECISION: Hire two engineers\n"
+        "  DECISION:   Keep the price  \n"
+        "ACTION: Draft the plan | OWNER: Product | DEADLINE: Q1\n"
+        "3. ACTION: Review costs | OWNER:  Finance \n"
+        "ACTION: Call the bank | DEADLINE: next week\n"
+        "ACTION: Tidy up\n"
+    )
+
+    assert [d["description"] for d in phase.decisions] == ["Hire two engineers", "Keep the price"]
+    assert all(d["status"] == "proposed" for d in phase.decisions)
+    assert [(a["description"], a["owner"], a["deadline"]) for a in phase.action_items] == [
+        ("Draft the plan", "Product", "Q1"),
+        ("Review costs", "Finance", "TBD"),
+        ("Call the bank", "TBD", "next week"),
+        ("Tidy up", "TBD", "TBD"),
+    ]
+    assert all(a["status"] == "todo" for a in phase.action_items)
+
+
+def test_extract_ignores_other_lines():
+    phase = _phase()
+    phase._extract_decisions_and_actions(
+        "SUMMARY: DECISION: not at the start\n"
+        "DECISIONS: plural heading\n"
+        "2. DECISIONS: [Clear decisions made]\n"
+        "decision: lower case\n"
+        "\n"
+    )
+    assert phase.decisions == []
+    assert phase.action_items == []
+
+
+def test_extract_reports_each_output():
+    seen = []
+    phase = _phase(lambda kind, item: seen.append((kind, item)))
+    phase._extract_decisions_and_actions("DECISION: Go\nnoise\nACTION: Do it | OWNER: CEO\n")
+    assert seen == [("DECISION", phase.decisions[0]), ("ACTION", phase.action_items[0])]
@@ -0,0 +1,35 @@
+"""ProviderManager's memoized provider ordering."""
+
+from core.llm.provider_manager import ProviderManager
+from core.llm.provider_types import ProviderConfig
+
+
+def _provider(provider_id: str, priority: int) -> ProviderConfig:
+    return ProviderConfig(
+        id=provider_id,
+        name=provider_id,
+        type="openai",
+        api_key="k",
+        default_model="m",
+        priority=priority,
+    )
+
+
+def test_enabled_providers_list_belongs_to_the_caller(tmp_path):
+    manager = ProviderManager(tmp_path / "providers.json")
+    manager.add_provider(_provider("backup", 5))
+
+    providers = manager.get_enabled_providers()
+    providers.reverse()
+    providers.append(_provider("extra", 9))
+
+    assert [p.id for p in manager.get_enabled_providers()] == ["kimi-proxypal", "backup"]
+
+
+def test_enabled_providers_follow_config_changes(tmp_path):
+    manager = ProviderManager(tmp_path / "providers.json")
+    manager.add_provider(_provider("first", 0))
+    assert [p.id for p in manager.get_enabled_providers()] == ["first", "kimi-proxypal"]
+
+    manager.disable_provider("first")
+    assert [p.id for p in manager.get_enabled_providers()] == ["kimi-proxypal"]
@@ -0,0 +1,197 @@
+"""AdaptiveLimiter's RPM/TPM windows and AIMD concurrency limit."""
+
+import asyncio
+import json
+
+import pytest
+
+from core.llm import rate_limit
+from core.llm.provider_manager import ProviderManager
+from core.llm.provider_types import DEFAULT_LIMITS, ProviderConfig, ProviderType
+from core.llm.rate_limit import WINDOW_SECONDS, AdaptiveLimiter
+
+
+class FakeClock:
+    """Stands in for time.monotonic and asyncio.sleep; sleeping advances it."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.slept.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(rate_limit.asyncio, "sleep", clock.sleep)
+    return clock
+
+
+def _limiter(**limits) -> AdaptiveLimiter:
+    options = {
+        "max_concurrency": 4,
+        "rpm": 1000,
+        "latency_target_ms": 1000,
+        "alpha": 1.0,
+        "beta": 0.5,
+        **limits,
+    }
+    return AdaptiveLimiter(**options)
+
+
+async def _acquire(limiter: AdaptiveLimiter, tokens: int) -> list:
+    reservation = await limiter.acquire(tokens)
+    await limiter.release()
+    return reservation
+
+
+def test_tpm_window_holds_back_requests_over_budget(clock):
+    # 90% headroom: 900 of the 1000 tokens per minute are usable
+    limiter = _limiter(tpm=1000)
+
+    async def run():
+        await _acquire(limiter, 800)
+        await _acquire(limiter, 100)
+        assert clock.slept == []
+        await _acquire(limiter, 100)
+
+    asyncio.run(run())
+    assert clock.slept == [pytest.approx(WINDOW_SECONDS)]
+
+
+def test_tpm_waits_only_for_enough_old_entries_to_expire(clock):
+    limiter = _limiter(tpm=1000)
+
+    async def run():
+        await _acquire(limiter, 500)
+        clock.now += 10
+        await _acquire(limiter, 300)
+        clock.now += 10
+        # Needs the first entry gone (at 60s), not the second one (at 70s)
+        await _acquire(limiter, 400)
+
+    asyncio.run(run())
+    assert clock.slept == [pytest.approx(WINDOW_SECONDS - 20)]
+
+
+def test_settle_corrects_reservation_to_actual_usage(clock):
+    limiter = _limiter(tpm=1000)
+
+    async def run():
+        reservation = await _acquire(limiter, 800)
+        limiter.settle(reservation, 50)
+        await _acquire(limiter, 800)
+
+    asyncio.run(run())
+    assert clock.slept == []
+
+
+def test_no_tpm_limit_never_waits_for_tokens(clock):
+    limiter = _limiter(tpm=None)
+
+    async def run():
+        for _ in range(5):
+            await _acquire(limiter, 1_000_000)
+
+    asyncio.run(run())
+    assert clock.slept == []
+
+
+def test_rpm_window(clock):
+    limiter = _limiter(rpm=2)
+
+    async def run():
+        for _ in range(3):
+            await _acquire(limiter, 0)
+
+    asyncio.run(run())
+    assert clock.slept == [pytest.approx(WINDOW_SECONDS)]
+
+
+class StatusError(Exception):
+    """Provider error carrying an HTTP status and response headers."""
+
+    def __init__(self, status_code: int, headers: dict[str, str] | None = None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = type("Response", (), {"headers": headers or {}})()
+
+
+def test_aimd_grows_on_fast_successes_and_shrinks_on_rate_limits():
+    limiter = _limiter(max_concurrency=4, alpha=1.0, beta=0.5)
+
+    limiter.on_error(StatusError(429))
+    assert limiter.limit == 2.0
+    limiter.on_error(StatusError(503))
+    assert limiter.limit == 1.0
+    limiter.on_error(StatusError(429))
+    assert limiter.limit == 1.0  # Never below one slot
+
+    limiter.on_success(2.0)  # Slower than the 1s target
+    assert limiter.limit == 1.0
+    for _ in range(5):
+        limiter.on_success(0.1)
+    assert limiter.limit == 4.0  # Capped at max_concurrency
+
+
+def test_client_errors_leave_the_limit_alone():
+    limiter = _limiter()
+    limiter.on_error(StatusError(400))
+    limiter.on_error(ValueError("bad request"))
+    assert limiter.limit == 4.0
+
+
+def test_retry_after_blocks_new_requests(clock):
+    limiter = _limiter()
+    limiter.on_error(StatusError(429, {"retry-after": "5"}))
+
+    asyncio.run(_acquire(limiter, 0))
+    assert clock.slept == [pytest.approx(5.0)]
+
+
+def test_limit_caps_requests_in_flight():
+    limiter = _limiter(max_concurrency=2)
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        await limiter.acquire()
+        peak = max(peak, limiter.in_flight)
+        await asyncio.sleep(0.01)
+        await limiter.release()
+
+    async def run():
+        await asyncio.gather(*(call() for _ in range(6)))
+
+    asyncio.run(run())
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+def test_unset_limits_resolve_to_type_defaults_without_being_saved(tmp_path, monkeypatch):
+    manager = ProviderManager(tmp_path / "providers.json")
+    manager.add_provider(ProviderConfig(
+        id="p", name="p", type="openai", api_key="k", default_model="m", rpm=7,
+    ))
+
+    saved = json.loads((tmp_path / "providers.json").read_text())
+    entry = next(p for p in saved["providers"] if p["id"] == "p")
+    assert entry["rpm"] == 7
+    assert entry["tpm"] is None and entry["max_concurrency"] is None
+
+    provider = manager.get_provider("p")
+    limiter = manager.get_limiter(provider)
+    defaults = DEFAULT_LIMITS[ProviderType.OPENAI]
+    assert (limiter.rpm, limiter.tpm) == (7, defaults["tpm"])
+    assert limiter.max_concurrency == defaults["max_concurrency"]
+
+    # A later change to the defaults reaches existing configs
+    monkeypatch.setitem(defaults, "tpm", 1234)
+    assert manager.get_limiter(provider).tpm == 1234